@@ -0,0 +1,85 @@
+from typing import List
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+
+class CurveCollection:
+    """
+    Curves of one data file drawn as one LineCollection, one artist instead
+    of a Line2D per curve. Curves are hidden by dropping their segments.
+    """
+
+    def __init__(self, ax: Axes, linewidth: float) -> None:
+        self.ax = ax
+        self.linewidth = linewidth
+        self.curves: List[CollectionCurve] = []
+        self.collection = LineCollection([], linewidths=linewidth)
+        return
+
+    def add_curve(
+        self, xs: np.ndarray, ys: np.ndarray, label: str, color: str
+    ) -> "CollectionCurve":
+        curve = CollectionCurve(self, xs, ys, label, color)
+        self.curves.append(curve)
+        return curve
+
+    def add_to_axes(self) -> None:
+        """Add collection with all its curves, data limits are updated once"""
+        self.update()
+        self.ax.add_collection(self.collection, autolim=True)
+        return
+
+    def update(self) -> None:
+        visible = [curve for curve in self.curves if curve.visible]
+        self.collection.set_segments([curve.segment for curve in visible])
+        self.collection.set_colors([curve.color for curve in visible])
+        return
+
+
+class CollectionCurve:
+    """
+    One curve of CurveCollection with methods of Line2D used by MplWidget
+    """
+
+    def __init__(
+        self,
+        group: CurveCollection,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        label: str,
+        color: str,
+    ) -> None:
+        self.group = group
+        self.label = label
+        self.color = color
+        self.visible = True
+        self.segment = np.column_stack([xs, ys])
+        return
+
+    def get_color(self) -> str:
+        return self.color
+
+    def get_label(self) -> str:
+        return self.label
+
+    def set_label(self, label: str) -> None:
+        self.label = label
+        return
+
+    def set_linestyle(self, ls: str) -> None:
+        self.visible = ls != "None"
+        self.group.update()
+        return
+
+    def set_data(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Set drawn points, collection is updated by `CurveCollection.update`"""
+        self.segment = np.column_stack([xs, ys])
+        return
+
+    def get_legend_handle(self) -> Line2D:
+        return Line2D(
+            [], [], color=self.color, linewidth=self.group.linewidth, label=self.label
+        )
@@ -1,3 +1,6 @@
+from typing import List
+
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 
 from app.PlotController import PlotController
@@ -58,6 +61,7 @@ class DraggableVerticalLine:
         if contains:
             self.pressed = True
             self.offset = event.xdata - self.x
+            self.controller.draggable_pressed.emit(self.index)
         return
 
     def on_motion(self, event):
@@ -77,10 +81,11 @@ class DraggableVerticalLine:
     def on_release(self, event):
         if self.pressed:
             self.pressed = False
+            self.controller.draggable_released.emit(self.index)
         return
 
     def set_position(self, x):
-        """Set the line position and update display"""
+        """Set the line position, display is updated by owner of the axes"""
         self.x = x
         self.line.set_xdata([x, x])
 
@@ -88,8 +93,6 @@ class DraggableVerticalLine:
         ylim = self.ax.get_ylim()
         self.text.set_position((x, ylim[0] + 0.05 * (ylim[1] - ylim[0])))
         self.text.set_text(f"x={x:.2f}")
-
-        self.canvas.draw()
         return
 
     def mpl_connect(self) -> None:
@@ -123,6 +126,9 @@ class DraggableVerticalLine:
         self.text.set_visible(False)
         return
     
+    def get_artists(self) -> List[Artist]:
+        return [self.line, self.text]
+
     def delete(self):
         self.hide()
         self.line.remove()
@@ -0,0 +1,53 @@
+import io
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from backend.results import ResultTable, TSV_DELIMITER
+
+# Larger tables are exported to file, as clipboard would need all text at once
+CLIPBOARD_MAX_CELLS = 2_000_000
+
+
+class ExportWorkerSignals(QObject):
+    progress = Signal(int, int)  # number of written cells, number of cells
+    error = Signal(str)  # error message
+    finished = Signal(str)  # exported text if no file was given, else ""
+
+
+class ExportWorker(QRunnable):
+    """
+    Writes result table from a QThreadPool thread, so GUI thread stays
+    responsive. Without `filepath` the text is returned by `finished` signal,
+    e.g. for clipboard.
+    """
+
+    def __init__(
+        self,
+        results: ResultTable,
+        filepath: str | None = None,
+        delimiter: str = TSV_DELIMITER,
+    ) -> None:
+        super().__init__()
+        self.results = results
+        self.filepath = filepath
+        self.delimiter = delimiter
+
+        self.signals = ExportWorkerSignals()
+        return
+
+    def run(self) -> None:
+        try:
+            if self.filepath is None:
+                buffer = io.StringIO()
+                self.results.write(buffer, self.delimiter, self.signals.progress.emit)
+                text = buffer.getvalue()
+            else:
+                with open(self.filepath, "w", encoding="utf-8", newline="") as file:
+                    self.results.write(file, self.delimiter, self.signals.progress.emit)
+                text = ""
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        self.signals.finished.emit(text)
+        return
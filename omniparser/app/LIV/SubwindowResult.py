@@ -1,10 +1,7 @@
 from typing import List, Dict
-from math import isnan
-import re
 
 from PySide6.QtWidgets import (
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QHBoxLayout,
     QWidget,
@@ -12,17 +9,17 @@ from PySide6.QtWidgets import (
     QMdiSubWindow,
     QPushButton,
 )
-import clipboard as clip
-import numpy as np
 
 from backend.LIVdata import LIVdata
 from app.MainController import MainController
 from app.SubController import SubController
 from app.SubwindowPlot import SubwindowPlot
-from backend.misc import my_float_format
+from app.ResultTableModel import ResultTableModel
+from app.ResultExport import ResultExportMixin
+from backend.results import ResultTable
 
 
-class SubwindowResult(QMdiSubWindow):
+class SubwindowResult(ResultExportMixin, QMdiSubWindow):
     def __init__(
         self, controller: "MainController", mdi: QMdiArea, index: int, _dict: Dict
     ):
@@ -56,9 +53,7 @@ class SubwindowResult(QMdiSubWindow):
 
         # Create "Quick clipboard" and "Show plot" buttons
         box = QHBoxLayout()
-        self.quick_clipboard_button = QPushButton("Quick clipboard")
-        self.quick_clipboard_button.clicked.connect(self.quick_clipboard_slot)
-        box.addWidget(self.quick_clipboard_button)
+        self.setup_export_buttons(box)
 
         show_plot_button = QPushButton("Open power(set current) plot")
         show_plot_button.clicked.connect(
@@ -86,103 +81,20 @@ class SubwindowResult(QMdiSubWindow):
 
         table_window_layout.addLayout(box)
 
-        N_cols = []
-        for data in datas:
-            LIV = data.LIV
-            LIV_rows = list(LIV.values())
-            for row in LIV_rows:
-                N_cols.append(len(row) + 1)
-        max_cols = max(N_cols)
-
-        # Create results table
-        self.table = QTableWidget()
-        self.table.setColumnCount(max_cols)
-        self.table.setRowCount(0)
-        self.table.setVerticalScrollMode(QTableWidget.ScrollPerPixel)
-        self.table.setHorizontalScrollMode(QTableWidget.ScrollPerPixel)
-        table_window_layout.addWidget(self.table)
-
-        # Edit table
-        for data_i, data in enumerate(datas):
-            # Append naming
-            if self.add_naming:
-                self.append_to_results_table(("Name", data.other_data["Name"]))
-
-            # Append other data
-            for name, value in data.other_data.items():
-                if name == "Name":
-                    continue
-
-                if re.search("frequency", name.lower()):
-                    self.append_to_results_table((name, f"{value:.0f} Hz"))
-                elif re.search("duration", name.lower()):
-                    self.append_to_results_table((name, my_float_format(value, self.ndigits) + " ms"))
-                else:
-                    self.append_to_results_table((name, value))
-
-            # Append LIV data
-            for i, (name, values) in enumerate(data.LIV.items()):
-                self.append_to_results_table(
-                    [
-                        name,
-                    ]
-                    + values
-                )
-
-            # Append empty row spacer
-            if data_i != len(datas) - 1:
-                self.add_row_to_results_table()
-
-        self.table.resizeColumnsToContents()
-        self.show()
-        return
+        self.setup_export_progress_bar(table_window_layout)
 
-    def add_row_to_results_table(self) -> None:
-        new_row_index = self.table.rowCount()
-        self.table.setRowCount(self.table.rowCount() + 1)
-        for i in range(self.table.columnCount()):
-            self.table.setItem(new_row_index, i, QTableWidgetItem())
-        return
+        self.results = ResultTable(datas, self.add_naming, self.ndigits)
 
-    def quick_clipboard_slot(self) -> None:
-        tmp = []
-        for i in range(self.table.rowCount()):
-            subtmp = []
-            for j in range(self.table.columnCount()):
-                value = self.table.item(i, j).text()
-                subtmp.append(value)
-            tmp.append("\t".join(subtmp))
-        clip.copy("\n".join(tmp))
-        return
+        # Create results table, cells are formatted only when visible
+        self.table = QTableView()
+        self.table.setModel(ResultTableModel(self.results, self.table))
+        self.table.setVerticalScrollMode(QTableView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QTableView.ScrollPerPixel)
+        table_window_layout.addWidget(self.table)
 
-    def append_to_results_table(self, array: List) -> None:
-        self.add_row_to_results_table()
-        for i, value in enumerate(array):
-
-            # None
-            if value is None:
-                self.table.item(self.table.rowCount() - 1, i).setText("")
-                continue
-
-            # Float
-            if isinstance(value, float):
-                if np.isnan(value) or isnan(value):
-                    self.table.item(self.table.rowCount() - 1, i).setText("NaN")
-                else:
-                    self.table.item(self.table.rowCount() - 1, i).setText(
-                        my_float_format(value, self.ndigits)
-                    )
-                continue
-
-            # String
-            if isinstance(value, str):
-                if "nan" == value.lower().strip():
-                    self.table.item(self.table.rowCount() - 1, i).setText("NaN")
-                else:
-                    self.table.item(self.table.rowCount() - 1, i).setText(value)
-                continue
-
-            print("Err")
+        # Sizing every column to contents would format every cell
+        self.table.resizeColumnToContents(0)
+        self.show()
         return
 
     def create_power_plot_window_slot(self, datas: List[LIVdata]) -> None:
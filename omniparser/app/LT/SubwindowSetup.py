@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 from os.path import join, basename, splitext
 from glob import iglob
 import re
@@ -19,13 +19,17 @@ from PySide6.QtWidgets import (
     QLabel,
     QFormLayout,
     QSpinBox,
+    QProgressBar,
 )
+from PySide6.QtCore import QThreadPool
 
-from backend.LTdata import LTdata, LTparser
+from backend.LTdata import LTdata
 from app.MainController import MainController
+from app.ParseWorker import ParseWorker
+from app.SetupCache import SetupCacheMixin
 
 
-class SubwindowSetup(QMdiSubWindow):
+class SubwindowSetup(SetupCacheMixin, QMdiSubWindow):
     def __init__(self, controller: "MainController", mdi: QMdiArea):
         self.controller = controller
         self.mdi = mdi
@@ -127,10 +131,28 @@ class SubwindowSetup(QMdiSubWindow):
         self.ndigits_spinbox.setValue(2)
         form2.addRow("# of digits after point", self.ndigits_spinbox)
 
+        self.setup_cache_ui(window_layout)
+
         self.start_button = QPushButton("Start")
         self.start_button.clicked.connect(self.start_slot)
         window_layout.addWidget(self.start_button)
 
+        box = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        box.addWidget(self.progress_bar)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setToolTip(
+            "This button will cancel parsing process. Files that are being parsed at the moment will be finished, but no result subwindow will be opened."
+        )
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_slot)
+        box.addWidget(self.cancel_button)
+        window_layout.addLayout(box)
+
+        self.status_label = QLabel()
+        window_layout.addWidget(self.status_label)
+
         self.show()
         return
 
@@ -260,33 +282,87 @@ class SubwindowSetup(QMdiSubWindow):
             self.table.item(current_row, 2).setText(file_basename)
         return
 
-    def parse(self) -> List[LTdata]:
-        parser = LTparser()
-        datas: List[LTdata] = []
+    def get_sources(self) -> Tuple[List[str], List[str]]:
+        filepaths: List[str] = []
+        names: List[str] = []
         for i in range(1, self.table.rowCount()):
             # Get filepath from GUI
-            item = self.table.item(i, 0)
-            filepath = item.text()
+            filepath = self.table.item(i, 0).text()
 
             # Check it is not empty
             if not filepath:
                 continue
+            filepaths.append(filepath)
+
+            # Get part name from GUI
+            names.append(self.table.item(i, 2).text())
+
+        if not filepaths:
+            raise Exception("Setup table is empty")
+
+        return filepaths, names
+
+    def start_slot(self) -> None:
+        filepaths, self.names = self.get_sources()
+        self.parse_errors: List[str] = []
+
+        self.update_cache()
+        self.cache_hits_at_start = self.get_cache_hits()
+        self.worker = ParseWorker("LT", filepaths, cache=self.cache)
+        self.worker.signals.progress.connect(self.parse_progress_slot)
+        self.worker.signals.error.connect(self.parse_error_slot)
+        self.worker.signals.finished.connect(self.parse_finished_slot)
+        self.worker.signals.cancelled.connect(self.parse_cancelled_slot)
+
+        self.start_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.progress_bar.setRange(0, len(filepaths))
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"Parsing {len(filepaths)} files...")
+        self.status_label.setToolTip("")
+        QThreadPool.globalInstance().start(self.worker)
+        return
+
+    def cancel_slot(self) -> None:
+        self.cancel_button.setEnabled(False)
+        self.status_label.setText("Cancelling...")
+        self.worker.cancel()
+        return
+
+    def parse_progress_slot(self, n_done: int, n_files: int) -> None:
+        self.progress_bar.setValue(n_done)
+        n_cached = self.get_cache_hits() - self.cache_hits_at_start
+        self.status_label.setText(
+            f"Parsed {n_done} of {n_files} files ({n_cached} from cache), {len(self.parse_errors)} failed"
+        )
+        return
+
+    def parse_error_slot(self, filepath: str, message: str) -> None:
+        self.parse_errors.append(f"{filepath}: {message}")
+        self.status_label.setToolTip("\n".join(self.parse_errors))
+        return
 
-            # Parse file to data
-            data = parser.parse(filepath)
+    def parse_cancelled_slot(self) -> None:
+        self.start_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+        self.status_label.setText("Parsing cancelled")
+        return
 
-            # Get part name from GUI, add to data
-            data.add_other_data("Name", self.table.item(i, 2).text())
+    def parse_finished_slot(self, results: List[LTdata | None]) -> None:
+        self.start_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
 
+        datas: List[LTdata] = []
+        for data, name in zip(results, self.names):
+            # Skip files that failed to parse
+            if data is None:
+                continue
+            data.add_other_data("Name", name)
             datas.append(data)
 
         if not datas:
-            raise Exception("Setup table is empty")
-
-        return datas
+            raise Exception("No files were parsed successfully")
 
-    def start_slot(self) -> None:
-        datas = self.parse()
         _dict = {
             "datas": datas,
             "add_naming": self.add_naming_checkbox.isChecked(),
@@ -1,9 +1,12 @@
-from typing import List, Tuple, Callable
+from typing import Dict, List, Tuple, Callable
+from math import nan
 import re
 
 import numpy as np
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QVBoxLayout, QWidget, QLineEdit
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.artist import Artist
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 from matplotlib.ticker import (
@@ -12,12 +15,31 @@ from matplotlib.ticker import (
     AutoLocator,
 )
 from matplotlib import pyplot as plt
-import mplcursors
 
+from backend.decimation import (
+    DECIMATION_MIN_POINTS,
+    PIXELS_PER_BIN,
+    decimate_min_max,
+    is_sorted,
+)
 from backend.misc import create_linear_approximation
+from backend.points import PointsIndex
+from backend.spectrum import find_half_max_width
 from app.DraggableLine import DraggableVerticalLine
 from app.PlotController import PlotController
 from app.LinearApproxLine import LinearApproxLine
+from app.CurveCollection import CurveCollection, CollectionCurve
+
+# Hover annotation is shown for nearest data point within this radius, pixels
+HOVER_RADIUS = 10
+
+# LIVspectrummean labels: name of curve and its DAT, curves with DAT=0ms are cold
+DAT_LABEL_PATTERN = r"(.*)\s\(DAT=([-+]?\d*\.?\d+)ms\)"
+ZERO_DAT_PATTERN = r"^0+\.?0*$"
+
+# Legend of plots drawn with LineCollections lists at most this number of
+# curves, all curves are in plot table
+LEGEND_MAX_CURVES = 50
 
 
 class MplWidget(QWidget):
@@ -47,6 +69,22 @@ class MplWidget(QWidget):
         self.lines_visibility: List[bool] = []
         self.lines: List[List[Line2D]] = []
         self.labels: List[str] = []
+        # Full data of plots, lines draw only decimated points of sorted curves
+        self.xss: List[np.ndarray] = []
+        self.yss: List[np.ndarray] = []
+        self.lines_decimated: List[bool] = []
+        # Points of every plot sorted by x for hover search
+        self.points_indexes: List[PointsIndex] = []
+        # Width at 1/2 max of every LIVintensity plot, None if not found
+        self.half_max_widths: List[float | None] = []
+        # Name and "DAT is 0" of every LIVspectrummean plot, None if label has
+        # no DAT, and index of DAT=0ms plot of same name it is compared with
+        self.DAT_namings: List[Tuple[str, bool] | None] = []
+        self.cold_plot_indexes: List[int | None] = []
+        # Groups of curves drawn as one LineCollection, see `plot_many`
+        self.curve_collections: List[CurveCollection] = []
+        # X limits and axes width of last decimation
+        self.decimation_view: Tuple[float, float, float] | None = None
 
         # Pairs of raggable lines
         self.draggable_lines: List[List[DraggableVerticalLine]] = []
@@ -56,6 +94,21 @@ class MplWidget(QWidget):
         self.approx_lines: List[LinearApproxLine] = []
         self.approx_lines_visibility: List[bool] = []
 
+        # Artists redrawn over cached background while draggable line is dragged
+        self.dragged_artists: List[Artist] = []
+        # Figure without animated artists, cached on every full draw
+        self.background = None
+        # Created by `connect_hover_cursor`
+        self.hover_annotation = None
+
+        # touch_legend / touch_plot only mark legend / canvas dirty, both are
+        # rendered once on next event loop tick. Counters are for profiling.
+        self.legend_dirty = False
+        self.plot_dirty = False
+        self.redraw_scheduled = False
+        self.redraws_requested = 0
+        self.redraws_coalesced = 0
+
         self.setup_ui()
         self.connect_controller()
         return
@@ -68,6 +121,9 @@ class MplWidget(QWidget):
         self.fig, self.axes = plt.subplots(figsize=self.figsize, dpi=self.dpi)
         self.canvas = FigureCanvas(self.fig)
         self.initial_box = self.axes.get_position()
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.canvas.mpl_connect("resize_event", self.on_resize)
+        self.axes.callbacks.connect("xlim_changed", self.on_xlim_changed)
 
         self.axes.grid(True, linestyle="--", alpha=0.7)
         self.axes.set_xlabel(self.xlabel)
@@ -81,9 +137,22 @@ class MplWidget(QWidget):
         self.setLayout(layout)
         return
 
-    def connect_mplcursor(self):
-        cursor = mplcursors.cursor(self.axes.lines)
-        cursor.connect("add", self.mplcursor_connect_function)
+    def connect_hover_cursor(self) -> None:
+        """
+        Show annotation of data point under mouse. Only data plots are searched,
+        each by its PointsIndex, annotation is blitted over cached background.
+        """
+        self.hover_annotation = self.axes.annotate(
+            "",
+            xy=(0.0, 0.0),
+            xytext=(15, 15),
+            textcoords="offset points",
+            bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow", alpha=0.9),
+            arrowprops=dict(arrowstyle="->"),
+            animated=True,
+            visible=False,
+        )
+        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
         return
 
     def connect_controller(self):
@@ -93,9 +162,13 @@ class MplWidget(QWidget):
         self.controller.draggable_visibility_toggled.connect(
             self.draggable_visibility_toggled_slot
         )
+        # Moved slot first: while dragging it updates approx line and blits
+        self.controller.draggable_changed_position.connect(self.draggable_moved_slot)
         self.controller.draggable_changed_position.connect(
             self.approx_line_update_position_slot
         )
+        self.controller.draggable_pressed.connect(self.draggable_pressed_slot)
+        self.controller.draggable_released.connect(self.draggable_released_slot)
         self.controller.draggable_visibility_toggled.connect(
             self.approx_line_visibility_toggled_slot
         )
@@ -121,9 +194,70 @@ class MplWidget(QWidget):
     ############################################################################
 
     def plot(self, X_data, Y_data, label, linewidth) -> None:
-        line = self.axes.plot(X_data, Y_data, label=label, linewidth=linewidth)
+        self.add_curve(X_data, Y_data, label, linewidth)
+        self.controller.touch_legend.emit()
+        return
+
+    def plot_many(
+        self,
+        labels: List[str],
+        xss: List[np.ndarray],
+        yss: List[np.ndarray],
+        linewidth: float,
+        groups: List[int] | None = None,
+    ) -> None:
+        """
+        Add all curves with one legend update. If `groups` (e.g. index of data
+        file of every curve) are given, curves of every group are drawn as one
+        LineCollection, curves are still shown and hidden one by one.
+        """
+        collections: Dict[int, CurveCollection] = {}
+        for i, (label, xs, ys) in enumerate(zip(labels, xss, yss)):
+            collection = None
+            if groups is not None:
+                if groups[i] not in collections:
+                    collections[groups[i]] = CurveCollection(self.axes, linewidth)
+                collection = collections[groups[i]]
+            self.add_curve(xs, ys, label, linewidth, collection)
+
+        for collection in collections.values():
+            collection.add_to_axes()
+        self.curve_collections.extend(collections.values())
+        self.controller.touch_legend.emit()
+        return
+
+    def add_curve(
+        self,
+        X_data,
+        Y_data,
+        label: str,
+        linewidth: float,
+        collection: CurveCollection | None = None,
+    ) -> None:
+        xs = np.asarray(X_data, dtype=np.float64)
+        ys = np.asarray(Y_data, dtype=np.float64)
+        decimated = len(xs) >= DECIMATION_MIN_POINTS and is_sorted(xs)
+        drawn_xs, drawn_ys = xs, ys
+        if decimated:
+            # Limits are not known before autoscale, decimate for full range
+            indexes = self.decimate(xs, ys, xs[0], xs[-1])
+            drawn_xs, drawn_ys = xs[indexes], ys[indexes]
+
+        if collection is None:
+            line = self.axes.plot(drawn_xs, drawn_ys, label=label, linewidth=linewidth)
+        else:
+            # Same colors as separate lines would get from property cycle
+            colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+            color = colors[len(self.lines) % len(colors)]
+            line = [collection.add_curve(drawn_xs, drawn_ys, label, color)]
         self.lines.append(line)
         self.labels.append(label)
+        self.xss.append(xs)
+        self.yss.append(ys)
+        self.points_indexes.append(PointsIndex(xs, ys))
+        self.half_max_widths.append(self.get_half_max_width(xs, ys))
+        self.add_DAT_naming(label)
+        self.lines_decimated.append(decimated)
         self.lines_visibility.append(True)
 
         self.draggable_lines.append(None)
@@ -131,7 +265,111 @@ class MplWidget(QWidget):
 
         self.approx_lines.append(None)
         self.approx_lines_visibility.append(False)
-        self.controller.touch_legend.emit()
+        return
+
+    def get_half_max_width(self, xs: np.ndarray, ys: np.ndarray) -> float | None:
+        """Peak width shown on hover, found once when plot is added"""
+        if self.role != "LIVintensity":
+            return None
+        try:
+            return find_half_max_width(xs, ys)
+        except Exception:
+            return None
+
+    def add_DAT_naming(self, label: str) -> None:
+        """
+        Match added plot with first DAT=0ms plot whose name contains its name.
+        Added DAT=0ms plot becomes cold plot of earlier plots without one.
+        """
+        naming = None
+        match = None
+        if self.role == "LIVspectrummean":
+            match = re.search(DAT_LABEL_PATTERN, label)
+        if match:
+            naming = match.group(1), bool(re.search(ZERO_DAT_PATTERN, match.group(2)))
+        self.DAT_namings.append(naming)
+        self.cold_plot_indexes.append(None)
+        if naming is None:
+            return
+
+        index = len(self.DAT_namings) - 1
+        name, is_cold = naming
+        for i, other_naming in enumerate(self.DAT_namings):
+            if other_naming is None:
+                continue
+            other_name, other_is_cold = other_naming
+            if other_is_cold and name in other_name:
+                self.cold_plot_indexes[index] = i
+                break
+        if not is_cold:
+            return
+        for i, other_naming in enumerate(self.DAT_namings[:-1]):
+            if other_naming is None or self.cold_plot_indexes[i] is not None:
+                continue
+            if other_naming[0] in name:
+                self.cold_plot_indexes[i] = index
+        return
+
+    def get_data(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Full data of plot, drawn line may have only part of points"""
+        return self.xss[index], self.yss[index]
+
+    def decimate(
+        self, xs: np.ndarray, ys: np.ndarray, x_min: float, x_max: float
+    ) -> np.ndarray:
+        N_bins = max(int(self.axes.bbox.width) // PIXELS_PER_BIN, 1)
+        return decimate_min_max(xs, ys, x_min, x_max, N_bins)
+
+    def update_decimation(self) -> None:
+        """Decimate sorted curves again for current x limits and axes width"""
+        if not any(self.lines_decimated):
+            return
+        x_min, x_max = sorted(self.axes.get_xlim())
+        view = (x_min, x_max, self.axes.bbox.width)
+        if view == self.decimation_view:
+            return
+        self.decimation_view = view
+
+        for line, xs, ys, decimated in zip(
+            self.lines, self.xss, self.yss, self.lines_decimated
+        ):
+            if not decimated:
+                continue
+            indexes = self.decimate(xs, ys, x_min, x_max)
+            line[0].set_data(xs[indexes], ys[indexes])
+        for collection in self.curve_collections:
+            collection.update()
+        return
+
+    def get_legend_handles(self) -> List[Artist]:
+        """
+        Shown curves, then other labeled artists of axes, e.g. approximation
+        lines. Plots with collections list at most LEGEND_MAX_CURVES curves.
+        """
+        curves = [line[0] for line in self.lines if line[0].get_label()]
+        N_max = LEGEND_MAX_CURVES if self.curve_collections else len(curves)
+        handles = [
+            curve.get_legend_handle() if isinstance(curve, CollectionCurve) else curve
+            for curve in curves[:N_max]
+        ]
+        if len(curves) > N_max:
+            N_more = len(curves) - N_max
+            handles.append(Line2D([], [], linestyle="None", label=f"... {N_more} more"))
+
+        data_lines = set(line[0] for line in self.lines)
+        handles += [
+            handle
+            for handle in self.axes.get_legend_handles_labels()[0]
+            if handle not in data_lines
+        ]
+        return handles
+
+    def on_xlim_changed(self, axes) -> None:
+        self.update_decimation()
+        return
+
+    def on_resize(self, event) -> None:
+        self.update_decimation()
         return
 
     def hide_plot(self, index: int) -> None:
@@ -205,6 +443,129 @@ class MplWidget(QWidget):
         self.controller.touch_plot.emit()
         return
 
+    def get_dragged_artists(self, index: int) -> List[Artist]:
+        artists = []
+        for line in self.draggable_lines[index]:
+            artists.extend(line.get_artists())
+        if self.approx_lines_visibility[index]:
+            artists.append(self.approx_lines[index].line)
+        return artists
+
+    def draggable_pressed_slot(self, index: int) -> None:
+        """
+        Start of drag: render everything except dragged artists once, `on_draw`
+        caches it as background for blitting. One click can press overlapping
+        lines of several plots, artists of all of them are dragged.
+        """
+        artists = [
+            artist
+            for artist in self.get_dragged_artists(index)
+            if artist not in self.dragged_artists
+        ]
+        for artist in artists:
+            artist.set_animated(True)
+        self.dragged_artists.extend(artists)
+        self.canvas.draw()
+        return
+
+    def draggable_moved_slot(self, index: int) -> None:
+        if not self.dragged_artists:
+            return
+        # Lines are redrawn even if window can not be approximated
+        try:
+            self.update_approx_line(index)
+        except Exception:
+            pass
+        self.blit_animated_artists()
+        return
+
+    def draggable_released_slot(self, index: int) -> None:
+        """End of drag: dragged artists become static, full redraw"""
+        for artist in self.dragged_artists:
+            artist.set_animated(False)
+        self.dragged_artists = []
+        # Background lacks released artists until redraw
+        self.background = None
+        self.controller.touch_legend.emit()
+        self.controller.touch_plot.emit()
+        return
+
+    def on_draw(self, event) -> None:
+        # Animated artists are not drawn by full draw, it is a new background.
+        # They are drawn into renderer only, the draw itself shows them: blit
+        # here would repaint canvas from inside its own paint event.
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_animated_artists()
+        return
+
+    def draw_animated_artists(self) -> None:
+        for artist in self.get_animated_artists():
+            self.fig.draw_artist(artist)
+        return
+
+    def get_animated_artists(self) -> List[Artist]:
+        artists = list(self.dragged_artists)
+        if self.hover_annotation is not None and self.hover_annotation.get_visible():
+            artists.append(self.hover_annotation)
+        return artists
+
+    def blit_animated_artists(self) -> None:
+        """Restore cached background and draw only animated artists over it"""
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_animated_artists()
+        self.canvas.blit(self.fig.bbox)
+        return
+
+    ############################################################################
+    # HOVER ANNOTATION #########################################################
+    ############################################################################
+
+    def find_nearest_point(self, x: float, y: float) -> Tuple[int, int] | None:
+        """Plot index and point index of shown data point nearest to (x, y)"""
+        x_min, x_max = self.axes.get_xlim()
+        y_min, y_max = self.axes.get_ylim()
+        # Data units per pixel, axes are linear
+        x_scale = abs(x_max - x_min) / self.axes.bbox.width
+        y_scale = abs(y_max - y_min) / self.axes.bbox.height
+
+        nearest = None
+        nearest_distance = HOVER_RADIUS
+        for i, points_index in enumerate(self.points_indexes):
+            if not self.lines_visibility[i]:
+                continue
+            found = points_index.find_nearest(x, y, x_scale, y_scale, HOVER_RADIUS)
+            if found is not None and found[1] <= nearest_distance:
+                nearest = (i, found[0])
+                nearest_distance = found[1]
+        return nearest
+
+    def on_hover(self, event) -> None:
+        # No hover while dragging, panning or zooming
+        if event.button is not None or self.dragged_artists:
+            return
+        toolbar = self.canvas.toolbar
+        if toolbar is not None and toolbar.mode:
+            return
+
+        nearest = None
+        if event.inaxes is self.axes:
+            nearest = self.find_nearest_point(event.xdata, event.ydata)
+        if nearest is None:
+            if self.hover_annotation.get_visible():
+                self.hover_annotation.set_visible(False)
+                self.blit_animated_artists()
+            return
+
+        index, point_i = nearest
+        x, y = self.xss[index][point_i], self.yss[index][point_i]
+        self.hover_annotation.xy = (x, y)
+        self.hover_annotation.set_text(self.get_hover_text(index, x, y))
+        self.hover_annotation.set_visible(True)
+        self.blit_animated_artists()
+        return
+
     ############################################################################
     # APPROXIMATION LINES ######################################################
     ############################################################################
@@ -248,14 +609,9 @@ class MplWidget(QWidget):
         self.controller.touch_plot.emit()
         return
 
-    def approx_linear_regression(self, index: int) -> Tuple[float, float]:
-        # Do nothing if approx line is hidden
-        if not self.approx_lines_visibility[index]:
-            raise Exception("Plot is not visible")
-
+    def get_approx_window(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
         # Get data from the plot
-        x_data_all = self.lines[index][0].get_xdata(orig=True)
-        y_data_all = self.lines[index][0].get_ydata(orig=True)
+        x_data_all, y_data_all = self.get_data(index)
         draggable_line1, draggable_line2 = self.draggable_lines[index]
         x1, x2 = draggable_line1.x, draggable_line2.x
 
@@ -264,63 +620,32 @@ class MplWidget(QWidget):
             x1, x2 = x2, x1
 
         # Get points between draggable lines
-        indexes_window = []
-        for i, x in enumerate(x_data_all):
-            if x1 <= x and x < x2:
-                indexes_window.append(i)
+        in_window = (x1 <= x_data_all) & (x_data_all < x2)
 
         # Ignore of there are no points between draggable lines
-        if not indexes_window:
+        if not np.any(in_window):
             raise Exception("Not enough points to approximate plot")
 
-        x_data_window = []
-        y_data_window = []
-        for i in indexes_window:
-            tmpx = x_data_all[i]
-            tmpy = y_data_all[i]
-            if np.isnan(tmpx) or np.isnan(tmpy):
-                continue
-            x_data_window.append(tmpx)
-            y_data_window.append(tmpy)
+        in_window &= ~(np.isnan(x_data_all) | np.isnan(y_data_all))
+        return x_data_all[in_window], y_data_all[in_window]
+
+    def approx_linear_regression(self, index: int) -> Tuple[float, float]:
+        # Do nothing if approx line is hidden
+        if not self.approx_lines_visibility[index]:
+            raise Exception("Plot is not visible")
+
+        x_data_window, y_data_window = self.get_approx_window(index)
 
         _, slope, intersept = create_linear_approximation(x_data_window, y_data_window)
         return slope, intersept, x_data_window, y_data_window
 
     def approx_two_point(
         self, index: int
-    ) -> Tuple[float, float, List[float], List[float]]:
+    ) -> Tuple[float, float, np.ndarray, np.ndarray]:
         if not self.approx_lines_visibility[index]:
             raise Exception("Plot is not visible")
 
-        # Get data from the plot
-        x_data_all = self.lines[index][0].get_xdata(orig=True)
-        y_data_all = self.lines[index][0].get_ydata(orig=True)
-        draggable_line1, draggable_line2 = self.draggable_lines[index]
-        x1, x2 = draggable_line1.x, draggable_line2.x
-
-        # Swap if out of order
-        if x1 > x2:
-            x1, x2 = x2, x1
-
-        # Get points between draggable lines
-        indexes_window = []
-        for i, x in enumerate(x_data_all):
-            if x1 <= x and x < x2:
-                indexes_window.append(i)
-
-        # Ignore of there are no points between draggable lines
-        if not indexes_window:
-            raise Exception("Not enough points to approximate plot")
-
-        x_data_window = []
-        y_data_window = []
-        for i in indexes_window:
-            tmpx = x_data_all[i]
-            tmpy = y_data_all[i]
-            if np.isnan(tmpx) or np.isnan(tmpy):
-                continue
-            x_data_window.append(tmpx)
-            y_data_window.append(tmpy)
+        x_data_window, y_data_window = self.get_approx_window(index)
 
         if len(x_data_window) == 1:
             return (0.0, y_data_window[0], x_data_window, y_data_window)
@@ -332,6 +657,17 @@ class MplWidget(QWidget):
         return (slope, intersept, x_data_window, y_data_window)
 
     def approx_line_update_position_slot(self, index: int) -> None:
+        # While dragging, approx line is updated by `draggable_moved_slot`
+        if not self.approx_lines_visibility[index] or self.dragged_artists:
+            return
+        self.update_approx_line(index)
+        self.controller.touch_legend.emit()
+        self.controller.touch_plot.emit()
+        return
+
+    def update_approx_line(self, index: int) -> None:
+        if not self.approx_lines_visibility[index]:
+            return
         slope, intersept, _, y_data_window = self.approx_function(index)
 
         # Update approx line position and display parameters on the legend
@@ -376,15 +712,39 @@ class MplWidget(QWidget):
             case _:
                 raise Exception(f"{self.role}: unknown role")
         line.set_label("\n".join(annotation_texts))
-        self.controller.touch_legend.emit()
-        self.controller.touch_plot.emit()
         return
 
     def touch_plot_slot(self) -> None:
-        self.canvas.draw()
+        self.plot_dirty = True
+        self.schedule_redraw()
         return
 
     def touch_legend_slot(self) -> None:
+        self.legend_dirty = True
+        self.schedule_redraw()
+        return
+
+    def schedule_redraw(self) -> None:
+        self.redraws_requested += 1
+        if self.redraw_scheduled:
+            self.redraws_coalesced += 1
+            return
+        self.redraw_scheduled = True
+        QTimer.singleShot(0, self.redraw)
+        return
+
+    def redraw(self) -> None:
+        """Render all changes requested since last redraw: legend, then canvas"""
+        self.redraw_scheduled = False
+        if self.legend_dirty:
+            self.legend_dirty = False
+            self.update_legend()
+        if self.plot_dirty:
+            self.plot_dirty = False
+            self.canvas.draw_idle()
+        return
+
+    def update_legend(self) -> None:
         try:
             if self.legend:
                 self.legend.remove()
@@ -405,6 +765,7 @@ class MplWidget(QWidget):
         if self.legend_position_outside:
 
             self.legend = self.axes.legend(
+                handles=self.get_legend_handles(),
                 loc="center left",
                 bbox_to_anchor=(1.0, 0.5),
                 frameon=True,
@@ -436,7 +797,12 @@ class MplWidget(QWidget):
                 ]
             )
             self.legend = self.axes.legend(
-                loc="best", frameon=True, fancybox=True, shadow=True, fontsize=10
+                handles=self.get_legend_handles(),
+                loc="best",
+                frameon=True,
+                fancybox=True,
+                shadow=True,
+                fontsize=10,
             )
 
         return
@@ -458,159 +824,57 @@ class MplWidget(QWidget):
         self.controller.touch_plot.emit()
         return
 
-    def mplcursor_connect_function(self, selection: mplcursors.Selection):
-        label: str = selection.artist.get_label()
-
-        # if line is axis line
-        if re.findall(r"_child\d+", label):
-            selection.annotation.set_visible(False)
-            return
-
-        # if line is approximation line
-        if re.findall(r"k=[+-]?\d*\.\d+E[+-]\d+", label):
-            selection.annotation.set_visible(False)
-            return
+    def get_hover_text(self, index: int, x: float, y: float) -> str:
+        texts = [
+            self.labels[index],
+            f"{self.xlabel} = {x:.3f}",
+            f"{self.ylabel} = {y:.3f}",
+        ]
 
         # need to calculate overheating compared to cold wavelength
         if self.role == "LIVspectrummean":
             if self.user_defined_cold_wavelength:
-                selection.annotation.set_text(
-                    "\n".join(
-                        [
-                            selection.artist.get_label(),
-                            f"{self.xlabel} = {selection.target[0]:.3f}",
-                            f"{self.ylabel} = {selection.target[1]:.3f}",
-                            f"ΔT, °C (user defined) = {(selection.target[1]-self.cold_wavelength)/0.27:.3f}",
-                        ]
-                    )
+                texts.append(
+                    f"ΔT, °C (user defined) = {(y-self.cold_wavelength)/0.27:.3f}"
                 )
-            else:
-                naming_pattern = r"(.*)\s\(DAT=([-+]?\d*\.?\d+)ms\)"
-                zero_pattern = r"^0+\.?0*$"
-
-                # find all labels with similar pattern
-                this_naming_match = re.search(naming_pattern, label)
-                if not this_naming_match:
-                    return
-                this_naming = this_naming_match.group(1)
-                this_DAT = this_naming_match.group(2)
-
-                # if this_DAT=0ms
-                if re.search(zero_pattern, this_DAT):
-                    selection.annotation.set_text(
-                        "\n".join(
-                            [
-                                selection.artist.get_label(),
-                                f"{self.xlabel} = {selection.target[0]:.3f}",
-                                f"{self.ylabel} = {selection.target[1]:.3f}",
-                                f"ΔT, °C (user defined) = {(selection.target[1]-self.cold_wavelength)/0.27:.3f}",
-                            ]
-                        )
-                    )
-                    return
-
-                # find all indexes with same naming, but not DAT=0ms
-                same_naming_is: List[int] = []
-                for i, _label in enumerate(self.labels):
-                    match = re.search(naming_pattern, _label)
-                    if not match:
-                        continue
-                    other_naming, other_DAT = match.group(1), match.group(2)
-                    if this_naming not in other_naming:
-                        continue
-                    if re.search(zero_pattern, other_DAT):
-                        same_naming_is.append(i)
-                    else:
-                        continue
-
-                if not same_naming_is:
-                    return
-                other_i = same_naming_is[0]
-
-                other_line = self.lines[other_i][0]
-                other_x_data = other_line.get_xdata(orig=True)
-                other_y_data = other_line.get_ydata(orig=True)
-
-                for i in range(len(other_x_data) - 1):
-                    x1, x2 = other_x_data[i], other_x_data[i + 1]
-                    y1, y2 = other_y_data[i], other_y_data[i + 1]
-                    if x1 < selection.target[0] and selection.target[0] <= x2:
-                        k = (y2 - y1) / (x2 - x1)
-                        b = y1 - k * x1
-                        other_y = k * selection.target[0] + b
-                        break
-                else:
-                    other_y = self.cold_wavelength
-
-                selection.annotation.set_text(
-                    "\n".join(
-                        [
-                            selection.artist.get_label(),
-                            f"{self.xlabel} = {selection.target[0]:.3f}",
-                            f"{self.ylabel} = {selection.target[1]:.3f}",
-                            f"ΔT, °C (calc from DAT=0ms) = {(selection.target[1]-other_y)/0.27:.3f}",
-                        ]
-                    )
+                return "\n".join(texts)
+
+            naming = self.DAT_namings[index]
+            if naming is None:
+                return "\n".join(texts)
+
+            # if this_DAT=0ms
+            if naming[1]:
+                texts.append(
+                    f"ΔT, °C (user defined) = {(y-self.cold_wavelength)/0.27:.3f}"
                 )
+                return "\n".join(texts)
 
-            return
+            other_i = self.cold_plot_indexes[index]
+            if other_i is None:
+                return "\n".join(texts)
+
+            # Points sorted by x without NaN
+            other_xs = self.points_indexes[other_i].xs
+            other_ys = self.points_indexes[other_i].ys
+            other_y = np.interp(x, other_xs, other_ys, left=nan, right=nan)
+            if np.isnan(other_y):
+                other_y = self.cold_wavelength
+
+            texts.append(f"ΔT, °C (calc from DAT=0ms) = {(y-other_y)/0.27:.3f}")
+            return "\n".join(texts)
 
         # need to calculate width of "gaussian" plot at 1/2 * max
         if self.role == "LIVintensity":
-            x_data = selection.artist.get_xdata(orig=True)
-            y_data = selection.artist.get_ydata(orig=True)
-            y_max = np.max(y_data)
-            y_half = y_max / 2
-
-            x11, x12, x21, x22 = [None] * 4
-            y11, y12, y21, y22 = [None] * 4
-            for i in range(len(x_data) - 1):
-                x11, x12 = x_data[i], x_data[i + 1]
-                y11, y12 = y_data[i], y_data[i + 1]
-                if (y11 - y_half) * (y12 - y_half) < 0:
-                    break
+            width = self.half_max_widths[index]
+            if width is None:
+                texts.append("Δw @ 1/2 max, nm = n/a")
             else:
-                raise Exception("Could not find first half point")
-
-            for i in range(1, len(x_data) - 2):
-                x21, x22 = x_data[-i - 1], x_data[-i]
-                y21, y22 = y_data[-i - 1], y_data[-i]
-                if (y21 - y_half) * (y22 - y_half) < 0:
-                    break
-            else:
-                raise Exception("Could not find first half point")
-
-            k1 = (y12 - y11) / (x12 - x11)
-            b1 = y11 - k1 * x11
-            x1 = (y_half - b1) / k1
-
-            k2 = (y22 - y21) / (x22 - x21)
-            b2 = y21 - k2 * x21
-            x2 = (y_half - b2) / k2
-
-            selection.annotation.set_text(
-                "\n".join(
-                    [
-                        selection.artist.get_label(),
-                        f"{self.xlabel} = {selection.target[0]:.3f}",
-                        f"{self.ylabel} = {selection.target[1]:.3f}",
-                        f"Δw @ 1/2 max, nm = {abs(x2-x1):.3f}",
-                    ]
-                )
-            )
-            return
+                texts.append(f"Δw @ 1/2 max, nm = {width:.3f}")
+            return "\n".join(texts)
 
         # default behaviour
-        selection.annotation.set_text(
-            "\n".join(
-                [
-                    selection.artist.get_label(),
-                    f"{self.xlabel} = {selection.target[0]:.3f}",
-                    f"{self.ylabel} = {selection.target[1]:.3f}",
-                ]
-            )
-        )
-        return
+        return "\n".join(texts)
 
     def show_legend_slot(self) -> None:
         self.show_legend = True
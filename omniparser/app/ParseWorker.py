@@ -0,0 +1,67 @@
+from typing import List
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from backend.batch import parse_many
+from backend.cache import ParseCache
+
+
+class ParseWorkerSignals(QObject):
+    progress = Signal(int, int)  # number of processed files, number of files
+    error = Signal(str, str)  # filepath, error message
+    finished = Signal(list)  # parsed datas in input order, None for failed files
+    cancelled = Signal()
+
+
+class ParseWorker(QRunnable):
+    """
+    Parses files with `backend.batch.parse_many` from a QThreadPool thread,
+    so GUI thread stays responsive.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        filepaths: List[str],
+        workers: int | None = None,
+        cache: ParseCache | None = None,
+    ) -> None:
+        super().__init__()
+        self.kind = kind
+        self.filepaths = filepaths
+        self.workers = workers
+        self.cache = cache
+
+        self.signals = ParseWorkerSignals()
+        self.is_cancelled = False
+        return
+
+    def run(self) -> None:
+        datas = [None] * len(self.filepaths)
+        results = parse_many(
+            self.filepaths,
+            self.kind,
+            self.workers,
+            return_exceptions=True,
+            cache=self.cache,
+            yield_in_order=False,
+        )
+        # Files are reported as soon as each of them is done
+        for n_done, (i, result) in enumerate(results, start=1):
+            # Closing results cancels files that are not being parsed yet
+            if self.is_cancelled:
+                results.close()
+                self.signals.cancelled.emit()
+                return
+            if isinstance(result, Exception):
+                self.signals.error.emit(self.filepaths[i], str(result))
+                result = None
+            datas[i] = result
+            self.signals.progress.emit(n_done, len(self.filepaths))
+
+        self.signals.finished.emit(datas)
+        return
+
+    def cancel(self) -> None:
+        self.is_cancelled = True
+        return
@@ -6,6 +6,8 @@ class PlotController(QObject):
     plot_visibility_toggled = Signal(int)
     draggable_visibility_toggled = Signal(int)
     draggable_changed_position = Signal(int)
+    draggable_pressed = Signal(int)
+    draggable_released = Signal(int)
     touch_plot = Signal()
     touch_legend = Signal()
     update_ticks = Signal(tuple)
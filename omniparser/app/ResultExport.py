@@ -0,0 +1,101 @@
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import (
+    QBoxLayout,
+    QFileDialog,
+    QMessageBox,
+    QProgressBar,
+    QPushButton,
+)
+import clipboard as clip
+
+from app.ExportWorker import ExportWorker, CLIPBOARD_MAX_CELLS
+from backend.results import ResultTable, TSV_DELIMITER, CSV_DELIMITER
+
+
+class ResultExportMixin:
+    """
+    "Quick clipboard" and "Export to file" of result subwindows. Tables are
+    written by ExportWorker in background, progress is shown by a progress bar.
+    Subwindow must have `results` table before export is started.
+    """
+
+    results: ResultTable
+
+    def setup_export_buttons(self, box: QBoxLayout) -> None:
+        self.quick_clipboard_button = QPushButton("Quick clipboard")
+        self.quick_clipboard_button.clicked.connect(self.quick_clipboard_slot)
+        box.addWidget(self.quick_clipboard_button)
+
+        self.export_button = QPushButton("Export to file")
+        self.export_button.clicked.connect(self.export_slot)
+        box.addWidget(self.export_button)
+        return
+
+    def setup_export_progress_bar(self, layout: QBoxLayout) -> None:
+        self.export_progress_bar = QProgressBar()
+        self.export_progress_bar.setRange(0, 100)
+        self.export_progress_bar.setValue(0)
+        layout.addWidget(self.export_progress_bar)
+        return
+
+    def quick_clipboard_slot(self) -> None:
+        # Too large tables are exported to file instead
+        n_cells = self.results.cell_count()
+        if n_cells > CLIPBOARD_MAX_CELLS:
+            QMessageBox.information(
+                self,
+                "Table is too large for clipboard",
+                f"Table has {n_cells:,} cells, clipboard takes at most "
+                f"{CLIPBOARD_MAX_CELLS:,}. Choose a file to export results to.",
+            )
+            self.export_slot()
+            return
+        self.start_export(None)
+        return
+
+    def export_slot(self) -> None:
+        filepath, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export results",
+            "",
+            "Tab separated values (*.tsv);;Comma separated values (*.csv)",
+        )
+        if not filepath:
+            return
+        if filepath.lower().endswith(".csv"):
+            self.start_export(filepath, CSV_DELIMITER)
+        else:
+            self.start_export(filepath, TSV_DELIMITER)
+        return
+
+    def start_export(
+        self, filepath: str | None, delimiter: str = TSV_DELIMITER
+    ) -> None:
+        self.export_filepath = filepath
+        self.export_worker = ExportWorker(self.results, filepath, delimiter)
+        self.export_worker.signals.progress.connect(self.export_progress_slot)
+        self.export_worker.signals.error.connect(self.export_error_slot)
+        self.export_worker.signals.finished.connect(self.export_finished_slot)
+
+        self.quick_clipboard_button.setEnabled(False)
+        self.export_button.setEnabled(False)
+        self.export_progress_bar.setValue(0)
+        QThreadPool.globalInstance().start(self.export_worker)
+        return
+
+    def export_progress_slot(self, n_done: int, n_cells: int) -> None:
+        self.export_progress_bar.setValue(100 * n_done // max(n_cells, 1))
+        return
+
+    def export_error_slot(self, message: str) -> None:
+        self.quick_clipboard_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+        raise Exception(f"Could not export results: {message}")
+
+    def export_finished_slot(self, text: str) -> None:
+        self.quick_clipboard_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+        self.export_progress_bar.setValue(100)
+        if self.export_filepath is None:
+            clip.copy(text)
+        return
@@ -0,0 +1,30 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from backend.results import ResultTable
+
+
+class ResultTableModel(QAbstractTableModel):
+    """
+    Read-only Qt model over `ResultTable`. The view asks only for visible
+    cells, so opening a result window does not depend on length of series.
+    """
+
+    def __init__(self, results: ResultTable, parent=None) -> None:
+        super().__init__(parent)
+        self.results = results
+        return
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self.results.row_count()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self.results.column_count()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.results.cell(index.row(), index.column())
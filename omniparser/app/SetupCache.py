@@ -0,0 +1,95 @@
+from os.path import expanduser
+
+from PySide6.QtWidgets import (
+    QBoxLayout,
+    QCheckBox,
+    QFileDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLineEdit,
+    QPushButton,
+    QSpinBox,
+)
+
+from backend.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, ParseCache
+
+GIGABYTE = 1024**3
+CACHE_MAX_GIGABYTES = 1024
+
+
+class SetupCacheMixin:
+    """
+    Optional on-disk cache of parsed files of setup subwindows. Cache is off
+    by default, as in CLI, its folder and size limit are set in setup form.
+    """
+
+    def setup_cache_ui(self, layout: QBoxLayout) -> None:
+        self.cache: ParseCache | None = None
+
+        self.cache_checkbox = QCheckBox("Cache parsed files")
+        self.cache_checkbox.setToolTip(
+            "If this checkbox is checked, parsed files are saved to cache folder and unchanged files are not parsed again.\nLeast recently used files are removed from cache when it is over size limit."
+        )
+        self.cache_checkbox.setChecked(False)
+        self.cache_checkbox.toggled.connect(self.cache_checkbox_toggled_slot)
+        layout.addWidget(self.cache_checkbox)
+
+        form = QFormLayout()
+        layout.addLayout(form)
+
+        box = QHBoxLayout()
+        self.cache_dir_edit = QLineEdit(DEFAULT_CACHE_DIR)
+        box.addWidget(self.cache_dir_edit)
+        self.cache_dir_button = QPushButton("Browse")
+        self.cache_dir_button.clicked.connect(self.cache_dir_slot)
+        box.addWidget(self.cache_dir_button)
+        form.addRow("Cache folder", box)
+
+        self.cache_size_spinbox = QSpinBox()
+        self.cache_size_spinbox.setRange(1, CACHE_MAX_GIGABYTES)
+        self.cache_size_spinbox.setValue(DEFAULT_MAX_BYTES // GIGABYTE)
+        self.cache_size_spinbox.setSuffix(" GB")
+        form.addRow("Cache size limit", self.cache_size_spinbox)
+
+        self.cache_checkbox_toggled_slot(False)
+        return
+
+    def cache_checkbox_toggled_slot(self, is_checked: bool) -> None:
+        self.cache_dir_edit.setEnabled(is_checked)
+        self.cache_dir_button.setEnabled(is_checked)
+        self.cache_size_spinbox.setEnabled(is_checked)
+        return
+
+    def cache_dir_slot(self) -> None:
+        folderpath = QFileDialog.getExistingDirectory(
+            self, "Select cache folder", self.cache_dir_edit.text()
+        )
+        if folderpath:
+            self.cache_dir_edit.setText(folderpath)
+        return
+
+    def update_cache(self) -> None:
+        """Create cache for current settings, kept while they are the same"""
+        if not self.cache_checkbox.isChecked():
+            self.cache = None
+            return
+
+        cache_dir = expanduser(self.cache_dir_edit.text().strip())
+        max_bytes = self.cache_size_spinbox.value() * GIGABYTE
+        if not cache_dir:
+            raise Exception("Cache folder is empty")
+        if (
+            self.cache is not None
+            and self.cache.cache_dir == cache_dir
+            and self.cache.max_bytes == max_bytes
+        ):
+            return
+        try:
+            self.cache = ParseCache(cache_dir, max_bytes)
+        except OSError as error:
+            self.cache = None
+            raise Exception(f"Could not create cache folder {cache_dir}: {error}")
+        return
+
+    def get_cache_hits(self) -> int:
+        return self.cache.hits if self.cache is not None else 0
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
     QSplitter,
 )
 from PySide6.QtCore import Qt
+import numpy as np
 
 from backend.LTdata import LTdata
 from backend.LIVdata import LIVdata
@@ -25,6 +26,10 @@ from app.PlotController import PlotController
 from app.ModifiedToolbar import ModifiedToolbar
 from app.MplWidget import MplWidget
 
+# Plots with at least this number of curves draw curves of every data file as
+# one LineCollection
+COLLECTION_MIN_CURVES = 100
+
 
 class SubwindowPlot(QMdiSubWindow):
     def __init__(
@@ -41,8 +46,10 @@ class SubwindowPlot(QMdiSubWindow):
         self.datas = datas
 
         self.labels: List[str] = []
-        self.xss: List[List[float]] = []
-        self.yss: List[List[float]] = []
+        self.xss: List[np.ndarray] = []
+        self.yss: List[np.ndarray] = []
+        # Index of data of every curve
+        self.groups: List[int] = []
 
         super().__init__()
         self.parse_role()
@@ -109,22 +116,24 @@ class SubwindowPlot(QMdiSubWindow):
         match self.role:
             case "LIVpower":
                 keys_filter = ["Power, W", "OPM"]
-                for data in self.datas:
+                for data_i, data in enumerate(self.datas):
                     for key in keys_filter:
                         if key in data.LIV.keys():
                             self.labels.append(data.other_data["Name"])
                             self.xss.append(data.LIV["Set, A"])
                             self.yss.append(data.LIV[key])
+                            self.groups.append(data_i)
             case "LIVvoltage":
                 keys_filter = ["Voltage, V", "AI_Voltage"]
-                for data in self.datas:
+                for data_i, data in enumerate(self.datas):
                     for key in keys_filter:
                         if key in data.LIV.keys():
                             self.labels.append(data.other_data["Name"])
                             self.xss.append(data.LIV["Set, A"])
                             self.yss.append(data.LIV[key])
+                            self.groups.append(data_i)
             case "LIVspectrummean":
-                for data in self.datas:
+                for data_i, data in enumerate(self.datas):
                     keys = data.LIV.keys()
                     this_name = data.other_data["Name"]
                     for key in keys:
@@ -134,6 +143,7 @@ class SubwindowPlot(QMdiSubWindow):
                             )
                             self.xss.append(data.LIV["Set, A"])
                             self.yss.append(data.LIV[key])
+                            self.groups.append(data_i)
             case "LIVintensity":
                 datas: List[LTdata] = list(
                     filter(
@@ -141,18 +151,19 @@ class SubwindowPlot(QMdiSubWindow):
                         self.datas,
                     )
                 )
-                for data in datas:
-                    keys = data.LIV.keys()
-                    this_name = data.other_data["Name"]
-                    for key in keys:
-                        if "Intensity" in key:
-                            self.labels.append(str(key)[len("Intensity") :])
-                            self.xss.append(data.LIV["Wavelength1, nm"])
-                            self.yss.append(data.LIV[key])
+                for data_i, data in enumerate(datas):
+                    for spectrum in data.spectra:
+                        for j in range(len(spectrum.currents)):
+                            name = spectrum.get_intensity_name(j)
+                            self.labels.append(name[len("Intensity") :])
+                            self.xss.append(spectrum.wavelengths)
+                            self.yss.append(spectrum.get_intensity(j))
+                            self.groups.append(data_i)
             case "LTpower":
                 self.labels = [data.other_data["Name"] for data in self.datas]
                 self.xss = [data.LT["Reletive time, h"] for data in self.datas]
                 self.yss = [data.LT["Power (avg), W"] for data in self.datas]
+                self.groups = list(range(len(self.datas)))
             case "LTvoltage":
                 datas: List[LTdata] = list(
                     filter(lambda each: each.GIVIK_version == 2, self.datas)
@@ -160,6 +171,7 @@ class SubwindowPlot(QMdiSubWindow):
                 self.labels = [data.other_data["Name"] for data in datas]
                 self.xss = [data.LT["Reletive time, h"] for data in datas]
                 self.yss = [data.LT["Voltage, V"] for data in datas]
+                self.groups = list(range(len(datas)))
             case "LTtemperature":
                 datas: List[LTdata] = list(
                     filter(lambda each: each.GIVIK_version == 2, self.datas)
@@ -167,6 +179,7 @@ class SubwindowPlot(QMdiSubWindow):
                 self.labels = [data.other_data["Name"] for data in datas]
                 self.xss = [data.LT["Reletive time, h"] for data in datas]
                 self.yss = [data.LT["Tank water temp., C"] for data in datas]
+                self.groups = list(range(len(datas)))
             case "PULSEpower":
                 datas: List[LTdata] = list(
                     filter(lambda each: "LIV" in each.mode, self.datas)
@@ -174,6 +187,7 @@ class SubwindowPlot(QMdiSubWindow):
                 self.labels = [data.other_data["Name"] for data in datas]
                 self.xss = [data.LIV["Current, A"] for data in datas]
                 self.yss = [data.LIV["Power, W"] for data in datas]
+                self.groups = list(range(len(datas)))
             case "PULSEvoltage":
                 datas: List[LTdata] = list(
                     filter(lambda each: "LIV" in each.mode, self.datas)
@@ -181,18 +195,19 @@ class SubwindowPlot(QMdiSubWindow):
                 self.labels = [data.other_data["Name"] for data in datas]
                 self.xss = [data.LIV["Current, A"] for data in datas]
                 self.yss = [data.LIV["Voltage, V"] for data in datas]
+                self.groups = list(range(len(datas)))
             case "PULSEintensity":
                 datas: List[LTdata] = list(
                     filter(lambda each: "Spectrum" in each.mode, self.datas)
                 )
-                for data in datas:
-                    keys = data.LIV.keys()
-                    this_name = data.other_data["Name"]
-                    for key in keys:
-                        if "Intensity" in key:
-                            self.labels.append(str(key)[len("Intensity") :])
-                            self.xss.append(data.LIV["Wavelength, nm"])
-                            self.yss.append(data.LIV[key])
+                for data_i, data in enumerate(datas):
+                    for spectrum in data.spectra:
+                        for j in range(len(spectrum.currents)):
+                            name = spectrum.get_intensity_name(j)
+                            self.labels.append(name[len("Intensity") :])
+                            self.xss.append(spectrum.wavelengths)
+                            self.yss.append(spectrum.get_intensity(j))
+                            self.groups.append(data_i)
             case _:
                 raise Exception("Unknown role of plot window")
         return
@@ -334,10 +349,12 @@ class SubwindowPlot(QMdiSubWindow):
         layout.addWidget(toolbar)
         layout.addWidget(self.mplwidget)
 
-        for i, (label, xs, ys) in enumerate(zip(self.labels, self.xss, self.yss)):
-            self.mplwidget.plot(xs, ys, label=label, linewidth=1)
+        groups = self.groups if len(self.labels) >= COLLECTION_MIN_CURVES else None
+        self.mplwidget.plot_many(
+            self.labels, self.xss, self.yss, linewidth=1, groups=groups
+        )
 
-        self.mplwidget.connect_mplcursor()
+        self.mplwidget.connect_hover_cursor()
 
         axhline_needed, axvline_needed = self.role_to_hvlines[self.role]
         if axhline_needed:
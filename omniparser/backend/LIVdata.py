@@ -3,9 +3,21 @@ from math import nan
 
 import re
 
-from backend.misc import convert_to_float_or_nan
-
-NUMBER_PATTERN = r"[-+]?\d*\.?\d+|NaN|nan|NAN"
+from backend.columns import Columns
+from backend.lines import LinesIndex
+from backend.spectrum import Spectrum, parse_spectrum_table
+from backend.tokenizer import convert_to_float_or_nan, find_numbers, parse_numbers
+
+LIV_SECTION_MARKERS = ["### LIV Data ###", "### Spectrum LIV Data ###"]
+SPECTRUM_SECTION_MARKER = "### Spectrum Data ###"
+DAT_MARKER = "DAT, ms"
+SPECTRUM_TABLE_MARKER = "--------"
+OTHER_DATA_PATTERNS = {
+    "Duration:": r"Duration:\s*([0-9]*\.?[0-9]+)us",
+    "Frequency:": r"Frequency:\s*([0-9]*\.?[0-9]+)Hz",
+}
+SECTION_MARKERS = [*LIV_SECTION_MARKERS, SPECTRUM_SECTION_MARKER]
+SECTION_MARKER_PREFIX = "###"
 
 
 class LIVdata:
@@ -13,7 +25,10 @@ class LIVdata:
         self.filepath = filepath
 
         self.lines: List[str] = []
-        self.LIV: Dict[str, List[float | str]] = {}
+        self.index: LinesIndex | None = None
+        self.sections: Dict[str, List[int]] = {}
+        self.LIV: Columns = Columns()
+        self.spectra: List[Spectrum] = []
         self.other_data: Dict = {}
         return
 
@@ -32,6 +47,9 @@ class LIVdata:
 
 
 class LIVparser:
+    # Bump when layout of parsed data changes, invalidates cached results
+    VERSION = 3
+
     def __init__(self) -> None:
         return
 
@@ -45,22 +63,33 @@ class LIVparser:
     def parse(self, filepath: str) -> LIVdata:
         data = LIVdata(filepath)
         self.get_lines(data)
+        self.index_lines(data)
         self.parse_LIV(data)
         self.parse_spectrim_data(data)
         self.parse_other_data(data)
+
+        # Index holds a copy of file text, it is not needed after parsing
+        data.index = None
         return data
 
-    def parse_LIV(self, data: LIVdata) -> None:
-        LIV_section_markers: List[str] = [
-            "### LIV Data ###",
-            "### Spectrum LIV Data ###",
-        ]
+    def index_lines(self, data: LIVdata) -> None:
+        """
+        Pre-pass over file: joins lines for fast substring search and saves
+        line indexes of every section marker, so sub-parsers jump straight to
+        their sections instead of scanning whole file.
+        """
+        data.index = LinesIndex(data.lines)
+        data.sections = {marker: [] for marker in SECTION_MARKERS}
+        for i in data.index.find_lines(SECTION_MARKER_PREFIX):
+            for marker in SECTION_MARKERS:
+                if marker in data.lines[i]:
+                    data.sections[marker].append(i)
+        return
 
+    def parse_LIV(self, data: LIVdata) -> None:
         section_is = []
-        for section_marker in LIV_section_markers:
-            for i, line in enumerate(data.lines):
-                if section_marker in line:
-                    section_is.append(i)
+        for section_marker in LIV_SECTION_MARKERS:
+            section_is.extend(data.sections[section_marker])
 
         if not section_is:
             return
@@ -87,120 +116,84 @@ class LIVparser:
                         continue
                     name, values = name_values
                     if marker == "WLmean, nm":
-                        DAT = re.findall(NUMBER_PATTERN, prev_line)[0]
+                        DAT = find_numbers(prev_line)[0]
                         if DAT:
                             name += f" (DAT={DAT}ms)"
                     data.add_LIV(name, values)
         return
 
     def parse_spectrim_data(self, data: LIVdata) -> None:
-        section_marker = "### Spectrum Data ###"
-        section_is = []
-        for i, line in enumerate(data.lines):
-            if section_marker in line:
-                section_is.append(i)
-
+        section_is = data.sections[SPECTRUM_SECTION_MARKER]
         if not section_is:
             return
-        i = section_is[0]
 
-        DAT = []
-        intensity_all = {}
+        # First DAT line follows section marker, next ones are searched after
+        # end of previous block
+        i = section_is[0] + 1
+        while i is not None:
+            spectrum_i = self.parse_spectrum_block(data, i)
+            if spectrum_i is None:
+                break
+            spectrum, i = spectrum_i
+
+            # Currents of first block are shown with LIV rows in result table
+            if not data.spectra:
+                data.add_LIV("Current, A", spectrum.currents)
+            data.spectra.append(spectrum)
+            i = data.index.find_line(DAT_MARKER, i)
+        return
 
-        # Go to first DAT and save
-        i += 1
-        DAT.append(re.findall(NUMBER_PATTERN, data.lines[i])[0])
+    def parse_spectrum_block(
+        self, data: LIVdata, i: int
+    ) -> Tuple[Spectrum, int] | None:
+        """
+        Parse "DAT, ms" block starting at line `i`: currents are 3 lines below,
+        data table starts after "--------" line. Returns spectrum and index of
+        line after block.
+        """
+        DAT_foundall = find_numbers(data.lines[i])
+        if not DAT_foundall:
+            return
+        DAT = DAT_foundall[0]
 
         # Go to currents
         i += 3
-        current_all = re.findall(NUMBER_PATTERN, data.lines[i])
-        for current in current_all:
-            intensity_all[f"Intensity (current={current}A, DAT={DAT[0]} ms)"] = []
+        currents = find_numbers(data.lines[i])
 
         # Find start of data
-        while "--------" not in data.lines[i]:
-            i += 1
-        i += 1
-
-        wl_all_first: List[float] = []
-        while foundall := re.findall(NUMBER_PATTERN, data.lines[i]):
-            line = data.lines[i]
-            wl_all_first.append(convert_to_float_or_nan(foundall[0]))
-            for j, current in enumerate(current_all):
-                intensity_all[
-                    f"Intensity (current={current}A, DAT={DAT[0]} ms)"
-                ].append(convert_to_float_or_nan(foundall[j + 1]))
-            i += 1
-
-        data.add_LIV("Current, A", current_all)
-        data.add_LIV("Wavelength1, nm", wl_all_first)
-        data.LIV.update(intensity_all)
-
-        #####################################################
-
-        # Find second DAT and save
-        try:
-            while "DAT, ms" not in data.lines[i]:
-                i += 1
-            DAT.append(re.findall(NUMBER_PATTERN, data.lines[i])[0])
-        except: return
+        i = data.index.find_line(SPECTRUM_TABLE_MARKER, i)
+        if i is None:
+            raise Exception(f"Could not find spectrum table in file: {data.filepath}")
 
-        # Go to currents
-        i += 3
-        for current in current_all:
-            intensity_all[f"Intensity (current={current}A, DAT={DAT[1]} ms)"] = []
-
-        # Find start of data
-        while "--------" not in data.lines[i]:
-            i += 1
-        i += 1
-
-        wl_all_second: List[float] = []
-        while foundall := re.findall(NUMBER_PATTERN, data.lines[i]):
-            line = data.lines[i]
-            wl_all_second.append(convert_to_float_or_nan(foundall[0]))
-            for j, current in enumerate(current_all):
-                intensity_all[
-                    f"Intensity (current={current}A, DAT={DAT[1]} ms)"
-                ].append(convert_to_float_or_nan(foundall[j + 1]))
-            i += 1
-
-        data.add_LIV("Current, A", current_all)
-        data.add_LIV("Wavelength2, nm", wl_all_second)
-        data.LIV.update(intensity_all)
-        return
+        wavelengths, intensities, i = parse_spectrum_table(
+            data.lines, i + 1, len(currents)
+        )
+        wavelength_name = f"Wavelength{len(data.spectra) + 1}, nm"
+        spectrum = Spectrum(currents, wavelengths, intensities, wavelength_name, DAT)
+        return spectrum, i
 
     def parse_LIV_row(self, string, varname_pattern):
         varname_match = re.match(varname_pattern, string)
         if not varname_match:
             return
         varname = varname_match.group()
-        number_matches = re.findall(NUMBER_PATTERN, string[len(varname) :])
-        numbers = []
-        for match in number_matches:
-            try:
-                float_match = convert_to_float_or_nan(match)
-                numbers.append(float_match)
-            except ValueError:
-                numbers.append(nan)
-
+        numbers = parse_numbers(string[len(varname) :])
         return varname, numbers
 
-    def match_line_with_pattern(self, data: LIVdata, pattern: str) -> str:
-        for line in data.lines:
-            match = re.search(pattern, line)
+    def match_line_with_pattern(self, data: LIVdata, pattern: str, key: str) -> str:
+        # Only lines containing `key` (start of pattern) can match
+        i = data.index.find_line(key)
+        while i is not None:
+            match = re.search(pattern, data.lines[i])
             if match:
                 return match.group(1)
+            i = data.index.find_line(key, i + 1)
         return
 
     def parse_other_data(self, data: LIVdata) -> None:
-        other_data_patterns: List[str] = [
-            r"Duration:\s*([0-9]*\.?[0-9]+)us",
-            r"Frequency:\s*([0-9]*\.?[0-9]+)Hz",
-        ]
         other_data_names: List[str] = ["Duration, us", "Frequency, Hz"]
-        for i, pattern in enumerate(other_data_patterns):
-            value: str = self.match_line_with_pattern(data, pattern)
+        for i, (key, pattern) in enumerate(OTHER_DATA_PATTERNS.items()):
+            value: str = self.match_line_with_pattern(data, pattern, key)
 
             if i == 0:  # "Duration, us"
                 value = convert_to_float_or_nan(value) / 1000
@@ -1,20 +1,52 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterable, Iterator, TextIO
+from math import nan
+import io
 import re
 
+import numpy as np
+
+from backend.columns import Columns
 from backend.misc import (
-    convert_timedelta_to_hours,
-    convert_string_to_timedelta,
-    normalize_time,
-    convert_hours_float_to_timedelta,
-    convert_timedelta_to_string,
-    convert_to_float_or_nan,
+    convert_strings_to_seconds,
+    convert_seconds_to_hours,
+    normalize_times,
+    convert_hours_to_strings,
 )
+from backend.tokenizer import NUMBER_PATTERN, convert_to_float_or_nan, find_numbers
 
 ABSOLUTE_TIME_PATTERN = r"\d{2}\.\d{2}\.\d{4}\s\d{2}:\d{2}:\d{2}"
 RELETIVE_TIME_PATTERN = r"\d+:\d{2}:\d{2}"
-NUMBER_PATTERN = r"[-+]?\d*\.?\d+|NaN|nan|NAN"
 NOTHING_PATTERN = r"$a"
 
+# Relative time or a number, so that a data row is tokenized in one pass.
+# A relative time match stands for its three numbers H, MM and SS.
+ROW_TOKEN_REGEX = re.compile(rf"({RELETIVE_TIME_PATTERN})|({NUMBER_PATTERN})")
+
+GIVIK1_FIRST_LINE_PATTERN = r"^#{96}$"
+GIVIK1_LT_MARKER_PATTERN = r"^-{96}$"
+GIVIK2_SECTION_MARKER_PATTERN = r"^#{258}$"
+GIVIK2_LT_MARKER_PATTERN = r"^-{261}$"
+
+GIVIK2_OTHER_DATA_PATTERNS = [
+    r"Pulse width:\s*([0-9]*\.?[0-9]+)\s*ms",
+    r"Repetition frequency:\s*([0-9]*\.?[0-9]+)\s*Hz",
+    r"Set operating current:\s*([0-9]*\.?[0-9]+)\s*A",
+]
+GIVIK2_OTHER_DATA_NAMES = [
+    "Pulse width, ms",
+    "Repetition frequency, Hz",
+    "Set operating current, A",
+]
+
+# LT data rows are parsed in bulk by chunks of this size. Chunks with
+# malformed rows are bisected down to the minimal size, then parsed row by row
+BLOCK_CHUNK_SIZE = 50_000
+BLOCK_MIN_BISECT_SIZE = 64
+
+# Positions of data row fields in the list of row numbers
+GIVIK1_COLUMNS = [-1]  # power
+GIVIK2_COLUMNS = [9, 10, 11, 13]  # current, voltage, power (avg), temperature
+
 
 class LTdata:
     def __init__(self, filepath: str) -> None:
@@ -22,7 +54,7 @@ class LTdata:
         self.GIVIK_version = None
 
         self.lines: List[str] = []
-        self.LT: Dict[str, List[float | str]] = {}
+        self.LT: Columns = Columns()
         self.other_data: Dict = {}
         return
 
@@ -41,6 +73,9 @@ class LTdata:
 
 
 class LTparser:
+    # Bump when layout of parsed data changes, invalidates cached results
+    VERSION = 1
+
     def __init__(self) -> None:
         return
 
@@ -51,21 +86,31 @@ class LTparser:
         data.lines = lines
         return
 
-    def parse(self, filepath: str) -> LTdata:
+    def parse(self, filepath: str, stream: bool = False) -> LTdata:
+        """
+        Parse LT file. With `stream=True` file is read line by line in one
+        forward pass and no raw lines are kept in `LTdata.lines`.
+        """
         data = LTdata(filepath)
+        if stream:
+            self.parse_stream(data)
+            return data
         self.get_lines(data)
         self.parse_GIVIK_version(data)
         self.parse_LT(data)
         self.parse_other_data(data)
         return data
 
+    def detect_GIVIK_version(self, first_line: str) -> int | None:
+        if re.search(GIVIK1_FIRST_LINE_PATTERN, first_line):
+            return 1
+        if re.search(GIVIK2_SECTION_MARKER_PATTERN, first_line):
+            return 2
+        return None
+
     def parse_GIVIK_version(self, data: LTdata) -> None:
-        first_line = data.lines[0]
-        if re.search(r"^#{96}$", first_line):
-            data.GIVIK_version = 1
-        elif re.search(r"^#{258}$", first_line):
-            data.GIVIK_version = 2
-        else:
+        data.GIVIK_version = self.detect_GIVIK_version(data.lines[0])
+        if data.GIVIK_version is None:
             raise Exception(
                 f"Could not determin GIVIK version for file: {data.filepath}"
             )
@@ -84,7 +129,7 @@ class LTparser:
     def parse_LT_GIVIK1(self, data: LTdata) -> None:
         last_line_with_marker = -1
         for line_i, line in enumerate(data.lines):
-            my_matches = re.findall(r"^-{96}$", line)
+            my_matches = re.findall(GIVIK1_LT_MARKER_PATTERN, line)
             if my_matches:
                 last_line_with_marker = line_i
 
@@ -94,34 +139,27 @@ class LTparser:
         LT_start_line_i = last_line_with_marker + 1
         LT_end_line_i = len(data.lines) - 1
 
-        times_str: List[str] = []
-        times_float: List[float] = []
-        powers: List[float] = []
-        for line_i in range(LT_start_line_i, LT_end_line_i):
-            line = data.lines[line_i]
-
-            # abs_time = re.findall(self.abs_date_pattern, line)[0]
-            rel_time = re.findall(RELETIVE_TIME_PATTERN, line)[-1]
-            power = re.findall(NUMBER_PATTERN, line)[-1]
-
-            times_str.append(rel_time)
-            times_float.append(
-                round(
-                    convert_timedelta_to_hours(convert_string_to_timedelta(rel_time)),
-                    ndigits=5,
-                )
-            )
-            powers.append(convert_to_float_or_nan(power))
+        rel_times, values = self.parse_LT_block(
+            data.lines[LT_start_line_i:LT_end_line_i], GIVIK1_COLUMNS
+        )
+        self.add_LT_GIVIK1(data, rel_times, values)
+        return
+
+    def add_LT_GIVIK1(
+        self, data: LTdata, rel_times: np.ndarray, values: np.ndarray
+    ) -> None:
+        # Relative times are kept as written in file
+        times_float = convert_seconds_to_hours(convert_strings_to_seconds(rel_times))
 
-        data.add_LT("Reletive time", times_str)
-        data.add_LT("Reletive time, h", normalize_time(times_float))
-        data.add_LT("Power (avg), W", powers)
+        data.add_LT("Reletive time", rel_times)
+        data.add_LT("Reletive time, h", normalize_times(times_float))
+        data.add_LT("Power (avg), W", values[:, 0])
         return
 
     def parse_LT_GIVIK2(self, data: LTdata) -> None:
         section_start_is = []
         for i, line in enumerate(data.lines):
-            my_matches = re.findall(r"^#{258}$", line)
+            my_matches = re.findall(GIVIK2_SECTION_MARKER_PATTERN, line)
             if my_matches:
                 section_start_is.append(i)
         section_start_is.append(len(data.lines) - 1)
@@ -133,59 +171,209 @@ class LTparser:
             section_end_i = section_start_is[section_i + 1]
             LT_start_i = -1
             for line_i in range(section_start_i, section_end_i):
-                if re.findall(r"^-{261}$", data.lines[line_i]):
+                if re.findall(GIVIK2_LT_MARKER_PATTERN, data.lines[line_i]):
                     LT_start_i = line_i
 
             LT_start_is.append(LT_start_i)
             LT_end_is.append(section_end_i)
 
-        rel_time_str_all = []
-        current_all = []
-        voltage_all = []
-        power_avg_all = []
-        temperature_all = []
+        blocks = []
         for section_i in range(len(section_start_is) - 1):
             section_start_line_i = LT_start_is[section_i] + 1
             section_end_line_i = LT_end_is[section_i]
+            blocks.append(
+                self.parse_LT_block(
+                    data.lines[section_start_line_i:section_end_line_i],
+                    GIVIK2_COLUMNS,
+                )
+            )
+        self.add_LT_GIVIK2(data, *self.concatenate_LT_blocks(blocks, GIVIK2_COLUMNS))
+        return
 
-            for line_i in range(section_start_line_i, section_end_line_i):
-                line = data.lines[line_i]
-
-                # abs_date = re.findall(ABSOLUTE_TIME_PATTERN, line)[0]
-                rel_time = re.findall(RELETIVE_TIME_PATTERN, line)[-1]
-                # pulse_count = re.findall(NUMBER_PATTERN, line)[0]
-                current = re.findall(NUMBER_PATTERN, line)[9]
-                voltage = re.findall(NUMBER_PATTERN, line)[10]
-                power_avg = re.findall(NUMBER_PATTERN, line)[11]
-                # power_imp = re.findall(NUMBER_PATTERN, line)[12]
-                tank_water_temp = re.findall(NUMBER_PATTERN, line)[13]
-
-                rel_time_str_all.append(rel_time)
-                current_all.append(convert_to_float_or_nan(current))
-                voltage_all.append(convert_to_float_or_nan(voltage))
-                power_avg_all.append(convert_to_float_or_nan(power_avg))
-                temperature_all.append(convert_to_float_or_nan(tank_water_temp))
-
-        timedeltas = [convert_string_to_timedelta(each) for each in rel_time_str_all]
-        float_times = [convert_timedelta_to_hours(each) for each in timedeltas]
-        float_times = [round(each, ndigits=5) for each in float_times]
-        normal_float_times = normalize_time(float_times)
-
-        normal_timedeltas = [
-            convert_hours_float_to_timedelta(each) for each in normal_float_times
-        ]
-        normal_time_strings = [
-            convert_timedelta_to_string(each) for each in normal_timedeltas
-        ]
+    def add_LT_GIVIK2(
+        self, data: LTdata, rel_times: np.ndarray, values: np.ndarray
+    ) -> None:
+        float_times = convert_seconds_to_hours(convert_strings_to_seconds(rel_times))
+        normal_float_times = normalize_times(float_times)
+        normal_time_strings = convert_hours_to_strings(normal_float_times)
 
         data.add_LT("Reletive time", normal_time_strings)
         data.add_LT("Reletive time, h", normal_float_times)
-        data.add_LT("Current, A", current_all)
-        data.add_LT("Voltage, V", voltage_all)
-        data.add_LT("Power (avg), W", power_avg_all)
-        data.add_LT("Tank water temp., C", temperature_all)
+        data.add_LT("Current, A", values[:, 0])
+        data.add_LT("Voltage, V", values[:, 1])
+        data.add_LT("Power (avg), W", values[:, 2])
+        data.add_LT("Tank water temp., C", values[:, 3])
+        return
+
+    def parse_LT_block(
+        self, lines: List[str], columns: List[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse block of LT data rows at once.
+
+        Rows are expected to have the layout of the first row. Numbers at
+        `columns` positions (as in `tokenize_row`) and relative times are
+        loaded in bulk by `np.loadtxt`, NaN values included. Chunks with
+        malformed rows are bisected, so only small parts around them are
+        parsed row by row, by the same fields with NaN for malformed values.
+
+        Returns relative times of rows and (rows x columns) array of values.
+        """
+        rel_times = np.empty(len(lines), dtype=object)
+        values = np.empty((len(lines), len(columns)))
+        if not lines:
+            return rel_times.astype(np.str_), values
+
+        layout = self.get_block_layout(lines[0], columns)
+        for chunk_start in range(0, len(lines), BLOCK_CHUNK_SIZE):
+            chunk_end = min(chunk_start + BLOCK_CHUNK_SIZE, len(lines))
+            self.load_LT_rows(
+                lines, chunk_start, chunk_end, columns, layout, rel_times, values
+            )
+        return rel_times.astype(np.str_), values
+
+    def load_LT_rows(
+        self,
+        lines: List[str],
+        start: int,
+        end: int,
+        columns: List[int],
+        layout: Tuple[int, List[int]] | None,
+        rel_times: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        if layout and end - start > BLOCK_MIN_BISECT_SIZE:
+            time_field, value_fields = layout
+            text = "".join(lines[start:end])
+            try:
+                block_rel_times = np.loadtxt(
+                    io.StringIO(text),
+                    dtype=np.str_,
+                    comments=None,
+                    usecols=time_field,
+                    ndmin=1,
+                )
+                block_values = np.loadtxt(
+                    io.StringIO(text),
+                    dtype=np.float64,
+                    comments=None,
+                    usecols=value_fields,
+                    ndmin=2,
+                )
+            except ValueError:
+                block_values = None
+
+            # Empty lines are skipped by np.loadtxt, so count must be checked too
+            if block_values is not None and len(block_values) == end - start:
+                rel_times[start:end] = block_rel_times
+                values[start:end] = block_values
+                return
+
+            middle = (start + end) // 2
+            self.load_LT_rows(
+                lines, start, middle, columns, layout, rel_times, values
+            )
+            self.load_LT_rows(lines, middle, end, columns, layout, rel_times, values)
+            return
+
+        # Rows are read by the same fields as in bulk, if layout is known
+        for i in range(start, end):
+            if layout:
+                rel_times[i], values[i] = self.parse_row_fields(lines[i], layout)
+            else:
+                rel_times[i], values[i] = self.parse_row(lines[i], columns)
         return
 
+    def get_block_layout(
+        self, line: str, columns: List[int]
+    ) -> Tuple[int, List[int]] | None:
+        """
+        Positions of whitespace separated fields of LT data row, that hold
+        relative time and numbers at `columns` positions. None if any of them
+        shares a field with something else, then rows are parsed one by one.
+        """
+        field_is: List[int] = []  # field of each number of the row
+        time_field = None
+        for field_i, field in enumerate(line.split()):
+            for time_match, number_match in ROW_TOKEN_REGEX.findall(field):
+                if time_match:
+                    time_field = field_i if time_match == field else None
+                    field_is.extend([None] * 3)
+                else:
+                    field_is.append(field_i if number_match == field else None)
+
+        if time_field is None:
+            return None
+        value_fields = []
+        for column in columns:
+            try:
+                field_i = field_is[column]
+            except IndexError:
+                return None
+            if field_i is None:
+                return None
+            value_fields.append(field_i)
+        return time_field, value_fields
+
+    def concatenate_LT_blocks(
+        self, blocks: List[Tuple[np.ndarray, np.ndarray]], columns: List[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if not blocks:
+            return np.array([], dtype=np.str_), np.empty((0, len(columns)))
+        rel_times, values = zip(*blocks)
+        return np.concatenate(rel_times), np.concatenate(values)
+
+    def tokenize_row(self, line: str) -> Tuple[str, List[str]]:
+        """
+        Split LT data row into its last relative time and all of its tokens
+        in a single regex pass. Every "H:MM:SS" time, relative or time of
+        day, gives three tokens H, MM and SS; other tokens are matches of
+        NUMBER_PATTERN. Token positions are the `columns` of `parse_row`.
+        """
+        rel_time = None
+        numbers: List[str] = []
+        for time_match, number_match in ROW_TOKEN_REGEX.findall(line):
+            if time_match:
+                rel_time = time_match
+                numbers.extend(time_match.split(":"))
+            else:
+                numbers.append(number_match)
+        if rel_time is None:
+            raise Exception(f"Could not find relative time in line: {line!r}")
+        return rel_time, numbers
+
+    def parse_row(self, line: str, columns: List[int]) -> Tuple[str, List[float]]:
+        """Parse LT data row to relative time and numbers at `columns` positions"""
+        rel_time, numbers = self.tokenize_row(line)
+        values = []
+        for column in columns:
+            try:
+                values.append(float(numbers[column]))
+            except IndexError:
+                values.append(nan)
+        return rel_time, values
+
+    def parse_row_fields(
+        self, line: str, layout: Tuple[int, List[int]]
+    ) -> Tuple[str, List[float]]:
+        """
+        Parse LT data row by whitespace separated fields of `layout`, as bulk
+        loading does. Missing or malformed values are NaN.
+        """
+        time_field, value_fields = layout
+        fields = line.split()
+        if time_field >= len(fields) or not re.fullmatch(
+            RELETIVE_TIME_PATTERN, fields[time_field]
+        ):
+            raise Exception(f"Could not find relative time in line: {line!r}")
+        values = []
+        for field_i in value_fields:
+            if field_i < len(fields):
+                values.append(convert_to_float_or_nan(fields[field_i]))
+            else:
+                values.append(nan)
+        return fields[time_field], values
+
     def parse_other_data(self, data: LTdata) -> None:
         match data.GIVIK_version:
             case 1:
@@ -200,21 +388,146 @@ class LTparser:
         return
 
     def parse_other_data_GIVIK2(self, data: LTdata) -> None:
-        other_data_patterns = [
-            r"Pulse width:\s*([0-9]*\.?[0-9]+)\s*ms",
-            r"Repetition frequency:\s*([0-9]*\.?[0-9]+)\s*Hz",
-            r"Set operating current:\s*([0-9]*\.?[0-9]+)\s*A",
-        ]
-        other_data_names = [
-            "Pulse width, ms",
-            "Repetition frequency, Hz",
-            "Set operating current, A",
-        ]
-        for pattern_i, pattern in enumerate(other_data_patterns):
+        for pattern_i, pattern in enumerate(GIVIK2_OTHER_DATA_PATTERNS):
             for line in data.lines:
                 if re.findall(pattern, line):
-                    value = re.findall(NUMBER_PATTERN, line)[0]
+                    value = find_numbers(line)[0]
                     data.add_other_data(
-                        other_data_names[pattern_i], convert_to_float_or_nan(value)
+                        GIVIK2_OTHER_DATA_NAMES[pattern_i],
+                        convert_to_float_or_nan(value),
                     )
         return
+
+    ############################################################################
+    # STREAMING MODE ###########################################################
+    ############################################################################
+
+    def iterate_lines(self, file: TextIO) -> Iterator[Tuple[str, bool]]:
+        """Yield (line, is_last_line) pairs of file"""
+        line = file.readline()
+        for next_line in file:
+            yield line, False
+            line = next_line
+        yield line, True
+
+    def parse_stream(self, data: LTdata) -> None:
+        with open(data.filepath, "r", errors="ignore") as file:
+            lines = self.iterate_lines(file)
+            first_line, _ = next(lines)
+            data.GIVIK_version = self.detect_GIVIK_version(first_line)
+            match data.GIVIK_version:
+                case 1:
+                    self.parse_stream_GIVIK1(data, lines)
+                case 2:
+                    self.parse_stream_GIVIK2(data, lines)
+                case _:
+                    raise Exception(
+                        f"Could not determin GIVIK version for file: {data.filepath}"
+                    )
+        return
+
+    def parse_stream_GIVIK1(
+        self, data: LTdata, lines: Iterable[Tuple[str, bool]]
+    ) -> None:
+        # Only rows after the last LT marker are LT data, last line is not
+        rows = None
+        for line, is_last in lines:
+            if is_last:
+                break
+            if re.search(GIVIK1_LT_MARKER_PATTERN, line):
+                rows = LTrowsBuffer(self, GIVIK1_COLUMNS)
+                continue
+            if rows is None:
+                continue
+            rows.append(line)
+
+        if rows is None:
+            raise Exception(f"Could not find LT start in file: {data.filepath}")
+
+        self.add_LT_GIVIK1(data, *rows.get())
+        return
+
+    def parse_stream_GIVIK2(
+        self, data: LTdata, lines: Iterable[Tuple[str, bool]]
+    ) -> None:
+        # Header values, the last match in file wins
+        other_data_values: Dict[int, float] = {}
+
+        # Only rows after the last LT marker of a section are LT data
+        blocks = []
+        section_rows = LTrowsBuffer(self, GIVIK2_COLUMNS)
+        in_LT = False
+        for line, is_last in lines:
+            if is_last:
+                # Last line is not LT data, but could still hold header values
+                self.match_other_data_GIVIK2(line, other_data_values)
+                break
+            if in_LT and not re.search(GIVIK2_SECTION_MARKER_PATTERN, line):
+                if re.search(GIVIK2_LT_MARKER_PATTERN, line):
+                    section_rows = LTrowsBuffer(self, GIVIK2_COLUMNS)
+                    continue
+                section_rows.append(line)
+                continue
+
+            if re.search(GIVIK2_SECTION_MARKER_PATTERN, line):
+                blocks.append(section_rows.get())
+                section_rows = LTrowsBuffer(self, GIVIK2_COLUMNS)
+                in_LT = False
+            elif re.search(GIVIK2_LT_MARKER_PATTERN, line):
+                in_LT = True
+            else:
+                self.match_other_data_GIVIK2(line, other_data_values)
+        blocks.append(section_rows.get())
+
+        self.add_LT_GIVIK2(data, *self.concatenate_LT_blocks(blocks, GIVIK2_COLUMNS))
+        for pattern_i, name in enumerate(GIVIK2_OTHER_DATA_NAMES):
+            if pattern_i in other_data_values:
+                data.add_other_data(name, other_data_values[pattern_i])
+        return
+
+    def match_other_data_GIVIK2(self, line: str, values: Dict[int, float]) -> None:
+        for pattern_i, pattern in enumerate(GIVIK2_OTHER_DATA_PATTERNS):
+            if re.search(pattern, line):
+                value = find_numbers(line)[0]
+                values[pattern_i] = convert_to_float_or_nan(value)
+        return
+
+
+class LTrowsBuffer:
+    """
+    LT data rows collected in streaming mode. Raw rows are parsed in bulk
+    every `BLOCK_CHUNK_SIZE` rows, so only one chunk of raw text is kept.
+    Parsing errors are raised only when the rows are requested, because
+    rows after a non-last LT marker are dropped anyway.
+    """
+
+    def __init__(self, parser: LTparser, columns: List[int]) -> None:
+        self.parser = parser
+        self.columns = columns
+        self.blocks: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.lines: List[str] = []
+        self.error: Exception | None = None
+        return
+
+    def append(self, line: str) -> None:
+        self.lines.append(line)
+        if len(self.lines) == BLOCK_CHUNK_SIZE:
+            self.flush()
+        return
+
+    def flush(self) -> None:
+        if self.lines and not self.error:
+            try:
+                self.blocks.append(
+                    self.parser.parse_LT_block(self.lines, self.columns)
+                )
+            except Exception as error:
+                self.error = error
+        self.lines = []
+        return
+
+    def get(self) -> Tuple[np.ndarray, np.ndarray]:
+        self.flush()
+        if self.error:
+            raise self.error
+        return self.parser.concatenate_LT_blocks(self.blocks, self.columns)
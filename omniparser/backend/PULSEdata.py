@@ -3,9 +3,23 @@ from math import nan
 
 import re
 
-from backend.misc import convert_to_float_or_nan
+import numpy as np
 
-NUMBER_PATTERN = r"[-+]?\d*\.?\d+|NaN|nan|NAN"
+from backend.columns import Columns
+from backend.lines import LinesIndex
+from backend.spectrum import Spectrum, parse_spectrum_table
+from backend.tokenizer import (
+    NUMBER_REGEX,
+    convert_to_float_or_nan,
+    find_numbers,
+    parse_number_table,
+)
+
+SECTION_MARKER = "**************"
+LIV_COLUMNS = ["Current, A", "Power, W", "Voltage, V", "Current Monitor, mV"]
+SPECTRUM_COLUMNS = ["Current, A", "FWHM, nm", "Mean WL, nm", "Max WL, nm", "Dispersion"]
+INTENSITY_HEADER = "Current, A"
+INTENSITY_HEADER_REGEX = re.compile(r"Current, A\s+\d+\s+")
 
 
 class PULSEdata:
@@ -14,8 +28,9 @@ class PULSEdata:
 
         self.lines: List[str] = []
         self.mode = None
-        self.LIV: Dict[str, List[float | str]] = {}
-        self.intensity: Dict[str, List[float | str]] = {}
+        self.index: LinesIndex | None = None
+        self.LIV: Columns = Columns()
+        self.spectra: List[Spectrum] = []
         self.other_data: Dict = {}
         return
 
@@ -34,6 +49,9 @@ class PULSEdata:
 
 
 class PULSEparser:
+    # Bump when layout of parsed data changes, invalidates cached results
+    VERSION = 3
+
     def __init__(self) -> None:
         return
 
@@ -47,89 +65,76 @@ class PULSEparser:
     def parse(self, filepath: str) -> PULSEdata:
         data = PULSEdata(filepath)
         self.get_lines(data)
+        self.parse_lines(data)
+        return data
+
+    def parse_lines(self, data: PULSEdata) -> None:
+        """Parse lines already read into `data`"""
         self.get_mode(data)
+        self.index_lines(data)
+
+        # LIV and spectrum columns are read from the same rows after first
+        # section marker, rows are tokenized once for both of them
+        N_cols = 0
+        if "LIV" in data.mode:
+            N_cols = max(N_cols, len(LIV_COLUMNS))
+        if "Spectrum" in data.mode:
+            N_cols = max(N_cols, len(SPECTRUM_COLUMNS))
+        section_lines = data.index.find_lines(SECTION_MARKER)
+        table = None
+        if N_cols and section_lines:
+            table = self.parse_section_table(data, section_lines[0], N_cols)
+
         if "LIV" in data.mode:
-            self.parse_LIV(data)
+            self.parse_LIV(data, table)
         if "Spectrum" in data.mode:
-            self.parse_spectrum(data)
+            self.parse_spectrum(data, table)
             self.parse_intensity(data)
-        return data
+
+        # Index holds a copy of file text, it is not needed after parsing
+        data.index = None
+        return
 
     def get_mode(self, data: PULSEdata) -> None:
         data.mode = data.lines[0]
         return
 
-    def parse_LIV(self, data: PULSEdata) -> None:
-        LIV_section_markers: List[str] = [
-            "**************",
-        ]
-
-        section_is = []
-        for section_marker in LIV_section_markers:
-            for i, line in enumerate(data.lines):
-                if section_marker in line:
-                    section_is.append(i)
-
-        if not section_is:
-            return
-
-        i = section_is[0]
-        while not re.findall(NUMBER_PATTERN, data.lines[i]):
-            i += 1
-
-        current_all = []
-        power_all = []
-        voltage_all = []
-        current_monitor = []
-        while foundall := re.findall(NUMBER_PATTERN, data.lines[i]):
-            current_all.append(convert_to_float_or_nan(foundall[0]))
-            power_all.append(convert_to_float_or_nan(foundall[1]))
-            voltage_all.append(convert_to_float_or_nan(foundall[2]))
-            current_monitor.append(convert_to_float_or_nan(foundall[3]))
-            i += 1
-
-        data.add_LIV("Current, A", current_all)
-        data.add_LIV("Power, W", power_all)
-        data.add_LIV("Voltage, V", voltage_all)
-        data.add_LIV("Current Monitor, mV", current_monitor)
+    def index_lines(self, data: PULSEdata) -> None:
+        """
+        Joins lines once for fast substring search, so section marker and
+        intensity table header are found without Python loops over file.
+        """
+        data.index = LinesIndex(data.lines)
         return
 
-    def parse_spectrum(self, data: PULSEdata) -> None:
-        LIV_section_markers: List[str] = [
-            "**************",
-        ]
+    def parse_section_table(
+        self, data: PULSEdata, section_line: int, N_cols: int
+    ) -> np.ndarray:
+        """
+        Table of numbers after section marker line, leading lines without
+        numbers (e.g. column names) are skipped.
+        """
+        i = section_line
+        while i < len(data.lines) and not NUMBER_REGEX.search(data.lines[i]):
+            i += 1
 
-        section_is = []
-        for section_marker in LIV_section_markers:
-            for i, line in enumerate(data.lines):
-                if section_marker in line:
-                    section_is.append(i)
+        table, _ = parse_number_table(data.lines, i, N_cols)
+        return table
 
-        if not section_is:
+    def parse_LIV(self, data: PULSEdata, table: np.ndarray | None) -> None:
+        if table is None:
             return
 
-        i = section_is[0]
-        while not re.findall(NUMBER_PATTERN, data.lines[i]):
-            i += 1
+        for name, values in zip(LIV_COLUMNS, table.T):
+            data.add_LIV(name, values)
+        return
 
-        current_all = []
-        fwhm_all = []
-        mean_wl_all = []
-        max_wl_all = []
-        dispersion_all = []
-        while foundall := re.findall(NUMBER_PATTERN, data.lines[i]):
-            current_all.append(convert_to_float_or_nan(foundall[0]))
-            fwhm_all.append(convert_to_float_or_nan(foundall[1]))
-            mean_wl_all.append(convert_to_float_or_nan(foundall[2]))
-            max_wl_all.append(convert_to_float_or_nan(foundall[3]))
-            dispersion_all.append(convert_to_float_or_nan(foundall[4]))
-            i += 1
+    def parse_spectrum(self, data: PULSEdata, table: np.ndarray | None) -> None:
+        if table is None:
+            return
 
-        data.add_LIV("Current, A", current_all)
-        data.add_LIV("FWHM, nm", fwhm_all)
-        data.add_LIV("Mean WL, nm", mean_wl_all)
-        data.add_LIV("Max WL, nm", max_wl_all)
-        data.add_LIV("Dispersion", dispersion_all)
+        for name, values in zip(SPECTRUM_COLUMNS, table.T):
+            data.add_LIV(name, values)
         return
 
     def match_line_with_pattern(self, data: PULSEdata, pattern: str) -> str:
@@ -151,31 +156,22 @@ class PULSEparser:
         return
 
     def parse_intensity(self, data: PULSEdata) -> None:
-        table_header_pattern = r"Current, A\s+\d+\s+"
-        for line_i, line in enumerate(data.lines):
-            if re.match(table_header_pattern, line):
-                break
-        else:
+        # Header has to start the line, so lines only containing it are skipped
+        line_i = data.index.find_line(INTENSITY_HEADER)
+        while line_i is not None and not INTENSITY_HEADER_REGEX.match(
+            data.lines[line_i]
+        ):
+            line_i = data.index.find_line(INTENSITY_HEADER, line_i + 1)
+        if line_i is None:
             return
 
-        current_all = re.findall(NUMBER_PATTERN, data.lines[line_i])
-        intensity_all = {}
-        for current in current_all:
-            intensity_all[f"Intensity (current={current}A)"] = []
-
-        wl_all = []
-        for i in range(line_i + 2, len(data.lines)):
-            line = data.lines[i]
-            foundall = re.findall(NUMBER_PATTERN, line)
-            if not foundall:
-                break
-            wl_all.append(convert_to_float_or_nan(foundall[0]))
-            for j, current in enumerate(current_all):
-                intensity_all[f"Intensity (current={current}A)"].append(
-                    convert_to_float_or_nan(foundall[j + 1])
-                )
-
-        data.add_LIV("Current, A", current_all)
-        data.add_LIV("Wavelength, nm", wl_all)
-        data.LIV.update(intensity_all)
+        currents = find_numbers(data.lines[line_i])
+        wavelengths, intensities, _ = parse_spectrum_table(
+            data.lines, line_i + 2, len(currents)
+        )
+        spectrum = Spectrum(currents, wavelengths, intensities, "Wavelength, nm")
+
+        # Currents are shown with LIV rows in result table
+        data.add_LIV("Current, A", spectrum.currents)
+        data.spectra.append(spectrum)
         return
@@ -0,0 +1,120 @@
+from typing import Dict, Iterable, Iterator, List
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import os
+
+from backend.cache import ParseCache
+from backend.LIVdata import LIVdata, LIVparser
+from backend.LTdata import LTdata, LTparser
+from backend.PULSEdata import PULSEdata, PULSEparser
+
+PARSERS = {"LIV": LIVparser, "LT": LTparser, "PULSE": PULSEparser}
+KINDS = tuple(PARSERS)
+
+
+def parse_file(filepath: str, kind: str) -> LIVdata | LTdata | PULSEdata:
+    """
+    Parse one file with parser of given kind ("LIV", "LT" or "PULSE").
+    Raw lines are not kept in returned data, so it is cheap to pickle.
+    """
+    match kind:
+        case "LIV":
+            data = LIVparser().parse(filepath)
+        case "LT":
+            data = LTparser().parse(filepath, stream=True)
+        case "PULSE":
+            data = PULSEparser().parse(filepath)
+        case _:
+            raise Exception(f"Unknown kind '{kind}', expected one of {KINDS}")
+    data.lines = []
+    return data
+
+
+def parse_many(
+    filepaths: Iterable[str],
+    kind: str,
+    workers: int | None = None,
+    return_exceptions: bool = False,
+    cache: ParseCache | None = None,
+    yield_in_order: bool = True,
+) -> Iterator[LIVdata | LTdata | PULSEdata | Exception]:
+    """
+    Parse files in a process pool of `workers` processes (all cores by default)
+    and yield datas in input order as soon as each of them is ready. With
+    `yield_in_order=False`, pairs (index of file, data) are yielded in order
+    of completion, so one slow file does not hold back the others.
+
+    If a file fails, its exception is raised, or yielded in place of data when
+    `return_exceptions=True`. Closing the iterator early cancels files which
+    are not being parsed yet and does not wait for running ones. With `cache`,
+    unchanged files are loaded from it and newly parsed ones are stored to it.
+    """
+    # Checked here, not on first iteration of generator
+    if kind not in KINDS:
+        raise Exception(f"Unknown kind '{kind}', expected one of {KINDS}")
+    return iterate_parsed(
+        list(filepaths), kind, workers, return_exceptions, cache, yield_in_order
+    )
+
+
+def collect_result(
+    future: Future,
+    key: str | None,
+    return_exceptions: bool,
+    cache: ParseCache | None,
+) -> LIVdata | LTdata | PULSEdata | Exception:
+    try:
+        data = future.result()
+    except Exception as e:
+        if not return_exceptions:
+            raise
+        return e
+    if cache is not None:
+        cache.store(key, data)
+    return data
+
+
+def iterate_parsed(
+    filepaths: List[str],
+    kind: str,
+    workers: int | None,
+    return_exceptions: bool,
+    cache: ParseCache | None,
+    yield_in_order: bool,
+) -> Iterator:
+    keys = [None] * len(filepaths)
+    if cache is not None:
+        version = PARSERS[kind].VERSION
+        keys = [cache.get_key(filepath, kind, version) for filepath in filepaths]
+    is_cached = [cache is not None and cache.contains(key) for key in keys]
+
+    n_uncached = max(is_cached.count(False), 1)
+    workers = workers or min(n_uncached, os.cpu_count() or 1)
+
+    # Processes are only started if some file is not cached
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            None if cached else executor.submit(parse_file, filepath, kind)
+            for filepath, cached in zip(filepaths, is_cached)
+        ]
+        pending: Dict[Future, int] = {}
+        for i, (filepath, key, future) in enumerate(zip(filepaths, keys, futures)):
+            data = cache.load(key) if future is None else None
+            if data is not None:
+                yield data if yield_in_order else (i, data)
+                continue
+
+            # Broken cache entry is parsed again
+            if future is None:
+                future = executor.submit(parse_file, filepath, kind)
+            if yield_in_order:
+                yield collect_result(future, key, return_exceptions, cache)
+            else:
+                pending[future] = i
+
+        for future in as_completed(pending):
+            i = pending[future]
+            yield i, collect_result(future, keys[i], return_exceptions, cache)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return
@@ -0,0 +1,143 @@
+from typing import List
+from os.path import join, expanduser, abspath
+import hashlib
+import os
+import pickle
+import threading
+
+DEFAULT_CACHE_DIR = join(expanduser("~"), ".omniparser", "cache")
+DEFAULT_MAX_BYTES = 2 * 1024**3
+CACHE_FILE_EXTENSION = ".pkl"
+# Eviction frees cache down to this part of `max_bytes`, so it is not needed
+# again on next stores
+EVICT_TO_FRACTION = 0.9
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed datas. Entry key is made of file path, size,
+    mtime, kind and parser version, so changed files are parsed again.
+    Least recently used entries are removed when cache is over `max_bytes`.
+    Size of cache is scanned once and then counted on every store, directory
+    is scanned again only to evict entries.
+    """
+
+    def __init__(
+        self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes: int | None = None
+        os.makedirs(cache_dir, exist_ok=True)
+        return
+
+    def get_key(self, filepath: str, kind: str, version: int) -> str | None:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        key = f"{abspath(filepath)}|{stat.st_size}|{stat.st_mtime_ns}|{kind}|{version}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def get_entry_path(self, key: str) -> str:
+        return join(self.cache_dir, key + CACHE_FILE_EXTENSION)
+
+    def contains(self, key: str | None) -> bool:
+        """Checks if entry exists, counts a miss if not"""
+        if key is not None and os.path.exists(self.get_entry_path(key)):
+            return True
+        self.misses += 1
+        return False
+
+    def load(self, key: str | None):
+        """Returns cached data or None"""
+        if key is None:
+            self.misses += 1
+            return None
+        entry_path = self.get_entry_path(key)
+        try:
+            # Mark as recently used
+            os.utime(entry_path)
+            with open(entry_path, "rb") as file:
+                data = pickle.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # Broken entry, e.g. written by other version of program
+            self.remove(entry_path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def store(self, key: str | None, data) -> None:
+        if key is None:
+            return
+        entry_path = self.get_entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        replaced_bytes = self.get_size(entry_path)
+        try:
+            with open(tmp_path, "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            # Cache is optional, e.g. disk is full
+            self.remove(tmp_path)
+            return
+
+        if self.total_bytes is None:
+            # New entry is counted by the scan
+            self.total_bytes = self.scan_total_bytes()
+        else:
+            self.total_bytes += self.get_size(entry_path) - replaced_bytes
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+        return
+
+    def get_size(self, path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def get_entries(self) -> List[os.DirEntry]:
+        return [
+            entry
+            for entry in os.scandir(self.cache_dir)
+            if entry.name.endswith(CACHE_FILE_EXTENSION)
+        ]
+
+    def scan_total_bytes(self) -> int:
+        return sum(entry.stat().st_size for entry in self.get_entries())
+
+    def evict(self) -> None:
+        entries = self.get_entries()
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+        self.total_bytes = total_bytes
+        if total_bytes <= self.max_bytes:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries:
+            if total_bytes <= self.max_bytes * EVICT_TO_FRACTION:
+                break
+            total_bytes -= entry.stat().st_size
+            self.remove(entry.path)
+        self.total_bytes = total_bytes
+        return
+
+    def remove(self, entry_path: str) -> None:
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+        return
+
+    def clear(self) -> None:
+        for entry in self.get_entries():
+            self.remove(entry.path)
+        self.total_bytes = 0
+        return
@@ -0,0 +1,138 @@
+from typing import Dict, Iterable, List
+from os.path import join
+from math import isfinite
+import json
+import os
+
+import numpy as np
+
+from backend.columns import to_column
+from backend.LIVdata import LIVdata
+from backend.LTdata import LTdata
+from backend.PULSEdata import PULSEdata
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_FORMAT = "omniparser-npy"
+MANIFEST_VERSION = 1
+
+
+def get_kind(data: LIVdata | LTdata | PULSEdata) -> str:
+    if isinstance(data, LIVdata):
+        return "LIV"
+    if isinstance(data, LTdata):
+        return "LT"
+    if isinstance(data, PULSEdata):
+        return "PULSE"
+    raise Exception(f"Unknown data type: {type(data).__name__}")
+
+
+def to_json_value(value):
+    # Numpy scalars of other data, NaN (missing) and inf become JSON null
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not isfinite(value):
+        return None
+    return value
+
+
+def save_array(directory: str, filename: str, values) -> str:
+    np.save(join(directory, filename), to_column(values), allow_pickle=False)
+    return filename
+
+
+def export_data(
+    directory: str, data_i: int, data: LIVdata | LTdata | PULSEdata
+) -> Dict:
+    """
+    Save series and spectra of one data as .npy files into `directory`.
+    Returns manifest entry of data with names of saved files.
+    """
+    prefix = f"{data_i:04d}"
+    series = data.LT if isinstance(data, LTdata) else data.LIV
+    columns = []
+    for column_i, (name, values) in enumerate(series.items()):
+        filename = save_array(directory, f"{prefix}_column{column_i:03d}.npy", values)
+        columns.append(
+            {
+                "name": name,
+                "file": filename,
+                "dtype": str(values.dtype),
+                "length": len(values),
+            }
+        )
+
+    spectra = []
+    data_spectra = [] if isinstance(data, LTdata) else data.spectra
+    for spectrum_i, spectrum in enumerate(data_spectra):
+        spectrum_prefix = f"{prefix}_spectrum{spectrum_i:02d}"
+        wavelengths_filename = save_array(
+            directory, f"{spectrum_prefix}_wavelengths.npy", spectrum.wavelengths
+        )
+        intensities_filename = save_array(
+            directory, f"{spectrum_prefix}_intensities.npy", spectrum.intensities
+        )
+        spectra.append(
+            {
+                "wavelength_name": spectrum.wavelength_name,
+                "DAT": spectrum.DAT,
+                "currents": spectrum.currents.tolist(),
+                "wavelengths": wavelengths_filename,
+                "intensities": intensities_filename,
+            }
+        )
+
+    other_data = {name: to_json_value(value) for name, value in data.other_data.items()}
+    return {
+        "name": other_data.get("Name"),
+        "kind": get_kind(data),
+        "filepath": data.filepath,
+        "other_data": other_data,
+        "columns": columns,
+        "spectra": spectra,
+    }
+
+
+def export_columnar(
+    datas: Iterable[LIVdata | LTdata | PULSEdata], directory: str
+) -> None:
+    """
+    Export datas as typed .npy arrays (one per column and per spectrum
+    matrix) with "manifest.json" holding names, other data and file names.
+    Arrays can be memory-mapped by `load_columnar`, no text is parsed again.
+    """
+    os.makedirs(directory, exist_ok=True)
+    entries = [export_data(directory, i, data) for i, data in enumerate(datas)]
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "datas": entries,
+    }
+    with open(join(directory, MANIFEST_FILENAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=1, allow_nan=False)
+    return
+
+
+def load_columnar(directory: str, mmap_mode: str | None = "r") -> List[Dict]:
+    """
+    Load export of `export_columnar`: manifest entries of datas, where file
+    names are replaced by arrays, columns by dict of column name -> array.
+    """
+    with open(join(directory, MANIFEST_FILENAME), "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise Exception(f"Not an omniparser export: {directory}")
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise Exception(f"Unsupported export version: {manifest.get('version')}")
+
+    def load(filename: str) -> np.ndarray:
+        return np.load(join(directory, filename), mmap_mode=mmap_mode)
+
+    entries = manifest["datas"]
+    for entry in entries:
+        entry["columns"] = {
+            column["name"]: load(column["file"]) for column in entry["columns"]
+        }
+        for spectrum in entry["spectra"]:
+            spectrum["wavelengths"] = load(spectrum["wavelengths"])
+            spectrum["intensities"] = load(spectrum["intensities"])
+    return entries
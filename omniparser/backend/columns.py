@@ -0,0 +1,37 @@
+from typing import Iterable
+
+import numpy as np
+
+
+class Columns(dict):
+    """
+    Columnar storage of measured series: column name -> column.
+
+    Numeric columns are stored as float64 `ndarray`, text columns (relative
+    times, currents kept as written in file) as numpy unicode arrays.
+    Values are converted on assignment, so lists can be added as before.
+    """
+
+    def __setitem__(self, name: str, values: Iterable) -> None:
+        super().__setitem__(name, to_column(values))
+        return
+
+    def update(self, *args, **kwargs) -> None:
+        for name, values in dict(*args, **kwargs).items():
+            self[name] = values
+        return
+
+
+def to_column(values: Iterable) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        if is_text_column(values):
+            return values
+        return values.astype(np.float64, copy=False)
+    values = list(values)
+    if any(isinstance(value, str) for value in values):
+        return np.array(values, dtype=np.str_)
+    return np.array(values, dtype=np.float64)
+
+
+def is_text_column(column: np.ndarray) -> bool:
+    return column.dtype.kind == "U"
@@ -0,0 +1,64 @@
+import numpy as np
+
+# Points kept per bin are first, last, min and max (M4), one bin per
+# `PIXELS_PER_BIN` pixels gives about 2 drawn points per pixel of width
+PIXELS_PER_BIN = 2
+# Shorter curves are drawn fast enough without decimation
+DECIMATION_MIN_POINTS = 10_000
+
+
+def is_sorted(xs: np.ndarray) -> bool:
+    """True if `xs` is non-decreasing and has no NaN"""
+    xs = np.asarray(xs, dtype=np.float64)
+    return not np.isnan(xs).any() and bool(np.all(xs[1:] >= xs[:-1]))
+
+
+def find_first_in_bins(
+    is_selected: np.ndarray, bin_ids: np.ndarray, offset: int
+) -> np.ndarray:
+    """Index of first selected point of every bin having one"""
+    positions = np.flatnonzero(is_selected)
+    _, firsts = np.unique(bin_ids[positions], return_index=True)
+    return positions[firsts] + offset
+
+
+def decimate_min_max(
+    xs: np.ndarray, ys: np.ndarray, x_min: float, x_max: float, N_bins: int
+) -> np.ndarray:
+    """
+    Indexes of points of curve with sorted `xs` to draw between `x_min` and
+    `x_max` on `N_bins` bins: first, last, min and max point of every bin,
+    first NaN of a bin keeps a gap of the line. Spikes and dropouts stay
+    visible, drawn line differs from the full one by less than a bin.
+    One point on each side of the range is kept, so line reaches the edges.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    start = max(int(np.searchsorted(xs, x_min, side="left")) - 1, 0)
+    end = min(int(np.searchsorted(xs, x_max, side="right")) + 1, len(xs))
+    if end - start <= 4 * N_bins or not x_max > x_min:
+        return np.arange(start, end)
+
+    xs, ys = xs[start:end], ys[start:end]
+    bins = np.floor((xs - x_min) * (N_bins / (x_max - x_min)))
+    # Points out of range go to bins -1 and N_bins
+    bins = np.clip(bins, -1, N_bins)
+    is_bin_start = np.empty(len(bins), dtype=np.bool_)
+    is_bin_start[0] = True
+    np.not_equal(bins[1:], bins[:-1], out=is_bin_start[1:])
+    bin_starts = np.flatnonzero(is_bin_start)
+    bin_ids = np.cumsum(is_bin_start) - 1
+
+    with np.errstate(invalid="ignore"):
+        bin_mins = np.fmin.reduceat(ys, bin_starts)[bin_ids]
+        bin_maxs = np.fmax.reduceat(ys, bin_starts)[bin_ids]
+    indexes = np.concatenate(
+        [
+            bin_starts + start,
+            np.append(bin_starts[1:] - 1, len(xs) - 1) + start,
+            find_first_in_bins(ys == bin_mins, bin_ids, start),
+            find_first_in_bins(ys == bin_maxs, bin_ids, start),
+            find_first_in_bins(np.isnan(ys), bin_ids, start),
+        ]
+    )
+    return np.unique(indexes)
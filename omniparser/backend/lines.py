@@ -0,0 +1,35 @@
+from typing import List
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LinesIndex:
+    """
+    Lines of a file joined into one text with line end offsets, built in one
+    pass. Lines containing a substring are found with `str.find` over the
+    text instead of a Python loop over lines.
+    """
+
+    def __init__(self, lines: List[str]) -> None:
+        self.text = "".join(lines)
+        self.line_ends = list(accumulate(map(len, lines)))
+        return
+
+    def find_line(self, key: str, start: int = 0) -> int | None:
+        """Index of first line at or after `start` containing `key`"""
+        start = min(start, len(self.line_ends))
+        offset = self.line_ends[start - 1] if start > 0 else 0
+        position = self.text.find(key, offset)
+        if position == -1:
+            return None
+        return bisect_right(self.line_ends, position)
+
+    def find_lines(self, key: str, start: int = 0) -> List[int]:
+        """Indexes of all lines at or after `start` containing `key`"""
+        line_is = []
+        i = self.find_line(key, start)
+        while i is not None:
+            line_is.append(i)
+            i = self.find_line(key, i + 1)
+        return line_is
+
@@ -1,101 +1,235 @@
-from typing import List, Union
-from datetime import timedelta
+from typing import List, Tuple, Union
 from os.path import dirname
 from math import nan
 
 
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
 
 
 def create_linear_approximation(xs, ys):
-    model = LinearRegression()
-    X = np.array(xs).reshape(-1, 1)
-    model.fit(X=X, y=ys)
-    y_pred = model.predict(X=X)
-    r2 = r2_score(ys, y_pred)
-    slope = model.coef_[0]
-    intercept = model.intercept_
-    return r2, slope, intercept
+    """
+    Least squares linear approximation of points in closed form
+
+    Returns:
+    - r2: R² score of approximation (as sklearn.metrics.r2_score)
+    - slope, intercept: parameters of approximation line
+    """
+    xs = np.asarray(xs, dtype=np.float64).ravel()
+    ys = np.asarray(ys, dtype=np.float64).ravel()
+    x_mean, y_mean = np.mean(xs), np.mean(ys)
+    dx, dy = xs - x_mean, ys - y_mean
+    Sxx, Sxy, Syy = dx @ dx, dx @ dy, dy @ dy
+
+    slope = Sxy / Sxx if Sxx > 0 else 0.0
+    intercept = y_mean - slope * x_mean
+    residuals = dy - slope * dx
+    SSres = residuals @ residuals
+
+    if len(xs) < 2:
+        r2 = nan
+    elif Syy > 0:
+        r2 = 1 - SSres / Syy
+    else:
+        r2 = 1.0 if SSres == 0 else 0.0
+    return float(r2), float(slope), float(intercept)
+
+
+def create_linear_approximations(
+    xss: List[List[float]], yss: List[List[float]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched `create_linear_approximation` for many non-empty (xs, ys) windows
+    of any sizes, fitted together with one set of array operations.
+
+    Returns arrays of R² scores, slopes and intercepts, one value per window.
+    """
+    sizes = np.array([len(xs) for xs in xss])
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    xs = np.concatenate([np.ravel(xs) for xs in xss]).astype(np.float64)
+    ys = np.concatenate([np.ravel(ys) for ys in yss]).astype(np.float64)
+
+    x_means = np.add.reduceat(xs, starts) / sizes
+    y_means = np.add.reduceat(ys, starts) / sizes
+    dx = xs - np.repeat(x_means, sizes)
+    dy = ys - np.repeat(y_means, sizes)
+    Sxx = np.add.reduceat(dx * dx, starts)
+    Sxy = np.add.reduceat(dx * dy, starts)
+    Syy = np.add.reduceat(dy * dy, starts)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = np.where(Sxx > 0, Sxy / Sxx, 0.0)
+        intercepts = y_means - slopes * x_means
+        residuals = dy - np.repeat(slopes, sizes) * dx
+        SSres = np.add.reduceat(residuals * residuals, starts)
+        r2s = np.where(Syy > 0, 1 - SSres / Syy, np.where(SSres == 0, 1.0, 0.0))
+    r2s[sizes < 2] = nan
+    return r2s, slopes, intercepts
+
+
+# Relative tolerance of R² comparison in `find_best_linear_subset`
+R2_TOLERANCE = 1e-9
+
+
+def is_same_r2(r2s, r2):
+    return np.isclose(r2s, r2, rtol=R2_TOLERANCE, atol=R2_TOLERANCE)
 
 
 def find_best_linear_subset(
-    xs: List[float], ys: List[float], min_window_size: int = 10, step_size: int = 1
+    xs: List[float],
+    ys: List[float],
+    min_window_size: int = 10,
+    step_size: int = 1,
+    r2_threshold: float | None = None,
 ):
     """
     Find the best linear subset using a sliding window approach
 
+    Cumulative sums of x, y, x², y² and xy are computed once, so slope,
+    intercept and R² of every window cost O(1).
+
     Parameters:
     - x: independent variable (1D array)
     - y: dependent variable (1D array)
     - min_window_size: minimum size of the linear segment to consider
     - step_size: step size for sliding the window
+    - r2_threshold: if given, the longest segment with R² not lower than
+      this threshold is returned instead of the segment with the best R²
 
     Returns:
     - best_start, best_end: indices of the best linear segment
     - best_r2: R² score of the best segment
+    - slope, intercept: linear approximation of the best segment
     """
 
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
     n = len(xs)
     best_r2 = -np.inf
     best_start = 0
     best_end = min_window_size
+    best_size = 0
+    slope, intercept = nan, nan
+    if n == 0:
+        return best_start, best_end, best_r2, slope, intercept
+
+    # Shift data to reduce cancellation errors in window sums
+    x0, y0 = xs[0], ys[0]
+    x, y = xs - x0, ys - y0
+    sums = [
+        np.concatenate(([0.0], np.cumsum(each)))
+        for each in (x, y, x * x, y * y, x * y)
+    ]
 
-    slope, intercept = 0.0, 0.0
     for start in range(0, n - min_window_size, step_size):
-        for end in range(start + min_window_size, n + 1, step_size):
-            # Extract window
-            x_window = xs[start:end].reshape(-1, 1)
-            y_window = ys[start:end]
+        ends = np.arange(start + min_window_size, n + 1, step_size)
+        size = ends - start
+        Sx, Sy, Sxx, Syy, Sxy = [each[ends] - each[start] for each in sums]
 
-            # Fit linear regression
-            r2, slope, intercept = create_linear_approximation(x_window, y_window)
+        # Centered sums of squares and products
+        Sxx = Sxx - Sx * Sx / size
+        Syy = Syy - Sy * Sy / size
+        Sxy = Sxy - Sx * Sy / size
 
-            # Update best segment if better R² found
-            if r2 > best_r2:
-                best_r2 = r2
-                best_start = start
-                best_end = end
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = np.where(Sxx > 0, Sxy / Sxx, 0.0)
+            r2s = np.where(Syy > 0, np.minimum(slopes * Sxy / Syy, 1.0), 1.0)
+
+        if r2_threshold is None:
+            # R² equal up to float noise of window sums are ties, first window
+            # found is kept as in a scan with strict improvement
+            r2_max = np.max(r2s)
+            if not r2_max > best_r2 or is_same_r2(r2_max, best_r2):
+                continue
+            i = np.flatnonzero(is_same_r2(r2s, r2_max))[0]
+        else:
+            good_is = np.flatnonzero(r2s >= r2_threshold)
+            if len(good_is) == 0:
+                continue
+            i = good_is[-1]  # sizes grow with end
+            if (size[i], r2s[i]) <= (best_size, best_r2):
+                continue
+
+        best_r2 = float(r2s[i])
+        best_start = start
+        best_end = int(ends[i])
+        best_size = int(size[i])
+        slope = float(slopes[i])
+        intercept = float(y0 + Sy[i] / size[i] - slope * (x0 + Sx[i] / size[i]))
 
     return best_start, best_end, best_r2, slope, intercept
 
 
-def convert_string_to_timedelta(string: str) -> timedelta:
-    H, M, S = [int(each) for each in string.split(":")]
-    return timedelta(hours=H, minutes=M, seconds=S)
+def convert_strings_to_seconds(strings: np.ndarray) -> np.ndarray:
+    """Relative times "H:MM:SS" to whole seconds, all at once"""
+    if not len(strings):
+        return np.empty(0, dtype=np.int64)
+    text = " ".join(np.asarray(strings).tolist()).replace(":", " ")
+    H, M, S = np.fromstring(text, dtype=np.int64, sep=" ").reshape(-1, 3).T
+    return H * 3600 + M * 60 + S
 
 
-def convert_timedelta_to_hours(delta: timedelta) -> float:
-    return delta.total_seconds() / 3600
+def convert_seconds_to_hours(seconds: np.ndarray) -> np.ndarray:
+    """
+    Same as `round(seconds / 3600, ndigits=5)` for every value.
+    seconds / 3600 * 10**5 = seconds * 250 / 9 is never closer than
+    1/18 to a half, so rounding it in integers gives the same 5 digits as
+    rounding the float.
+    """
+    seconds = np.asarray(seconds, dtype=np.int64)
+    return ((seconds * 500 + 9) // 18) / 10**5
 
 
-def normalize_time(times: List[float]) -> List[float]:
+def normalize_times(times: np.ndarray) -> np.ndarray:
+    """
+    Times restarted by the device made continuous: a time before a jump of
+    more than 1 h is added to base time of all following times. Cumulative
+    sum adds them in the same order as a loop over times would.
+    """
+    times = np.asarray(times, dtype=np.float64)
     delta_t_threshold = 1  # h
-    normal_time = [
-        times[0],
-    ]
-    base_time = 0.0
-    for i in range(len(times) - 1):
-        t1, t2 = times[i], times[i + 1]
-        if abs(t2 - t1) > delta_t_threshold:
-            base_time += t1
-        normal_time.append(base_time + t2)
-    return normal_time
+    is_jump = np.abs(np.diff(times)) > delta_t_threshold
+    base_times = np.cumsum(np.where(is_jump, times[:-1], 0.0))
+    return np.concatenate([times[:1], base_times + times[1:]])
+
 
+def convert_hours_to_strings(hours: np.ndarray) -> np.ndarray:
+    """
+    Hours to "HH:MM:SS" strings, same as formatting
+    `timedelta(seconds=hours * 3600)` of every value. timedelta rounds seconds
+    to microseconds (half to even) and the string drops them, so only
+    rounding up to the next whole second matters.
+    """
+    seconds = np.asarray(hours, dtype=np.float64) * 3600
+    whole_seconds = np.floor(seconds)
+    microseconds = np.rint((seconds - whole_seconds) * 10**6)
+    whole_seconds = whole_seconds.astype(np.int64) + (microseconds >= 10**6)
 
-def convert_hours_float_to_timedelta(hours: float) -> timedelta:
-    return timedelta(seconds=hours * 3600)
+    H, rem_S = np.divmod(whole_seconds, 3600)
+    M, S = np.divmod(rem_S, 60)
 
+    # ASCII bytes of "HH:MM:SS\n" in a row, hours right aligned to `width`
+    # columns with at least 2 digits, only `is_used` bytes are taken
+    n_H_digits = np.full(len(H), 2, dtype=np.int64)
+    for k in range(2, 19):
+        n_H_digits += H >= 10**k
+    width = int(n_H_digits.max(initial=2))
+    chars = np.empty((len(H), width + 7), dtype=np.uint8)
+    is_used = np.ones(chars.shape, dtype=np.bool_)
+    remainder = H
+    for column in range(width - 1, -1, -1):
+        remainder, digit = np.divmod(remainder, 10)
+        chars[:, column] = digit + ord("0")
+        is_used[:, column] = column >= width - n_H_digits
+    chars[:, width] = ord(":")
+    chars[:, width + 1] = M // 10 + ord("0")
+    chars[:, width + 2] = M % 10 + ord("0")
+    chars[:, width + 3] = ord(":")
+    chars[:, width + 4] = S // 10 + ord("0")
+    chars[:, width + 5] = S % 10 + ord("0")
+    chars[:, width + 6] = ord("\n")
 
-def convert_timedelta_to_string(td: timedelta) -> str:
-    D, S = td.days, td.seconds
-    H = D * 24 + S // 3600
-    rem_S = S % 3600
-    M = rem_S // 60
-    rem_S = rem_S % 60
-    HMS_strs = [str(H).rjust(2, "0"), str(M).rjust(2, "0"), str(rem_S).rjust(2, "0")]
-    return ":".join(HMS_strs)
+    strings = chars[is_used].tobytes().decode("ascii").split("\n")[:-1]
+    return np.array(strings, dtype=np.str_)
 
 
 def get_3_parents_dirs(filepath: str) -> List[str]:
@@ -105,18 +239,76 @@ def get_3_parents_dirs(filepath: str) -> List[str]:
     return (parent1, parent2, parent3)
 
 
-def convert_to_float_or_nan(string: str) -> float:
-    try:
-        return float(string)
-    except:
-        return nan
-    return
+# 10**ndigits must fit int64 in `format_floats`
+FORMAT_FLOATS_MAX_NDIGITS = 18
+
 
 def my_float_format(value: float, ndigits: int) -> str:
     default = f"{value:.{ndigits}f}"
+    # No point for ndigits=0, inf and NaN
+    if "." not in default:
+        return default
     before, after = default.split(".")
     after = after.rstrip("0")
     if after:
         return ".".join([before, after])
     else:
-        return before
\ No newline at end of file
+        return before
+
+
+def format_floats(values: np.ndarray, ndigits: int) -> List[str]:
+    """
+    `my_float_format` of every value of array at once, same strings.
+
+    Values are rounded as scaled integers, which gives the same digits as
+    f-string rounding unless the scaled value is (almost) halfway between two
+    integers or too large to be exact. Only those values, inf and NaN are
+    formatted one by one, as are all values if `ndigits` is larger than
+    FORMAT_FLOATS_MAX_NDIGITS and scaled integers do not fit int64.
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    if ndigits > FORMAT_FLOATS_MAX_NDIGITS:
+        return [my_float_format(value, ndigits) for value in values.tolist()]
+    scale = 10**ndigits
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = np.abs(values) * scale
+        is_exact = np.isfinite(scaled) & (scaled < 2**52)
+        is_exact &= np.abs(scaled - np.floor(scaled) - 0.5) > scaled * 2**-50
+    rounded = np.rint(np.where(is_exact, scaled, 0)).astype(np.int64)
+    integers, fractions = np.divmod(rounded, scale)
+    is_negative = np.signbit(values)
+
+    # ASCII bytes of every value in a row: sign and integer digits aligned to
+    # the right of `width` columns, point, fraction digits and a line break.
+    # Only `is_used` bytes are taken, so leading columns and trailing zeros
+    # of fraction are dropped.
+    n_digits = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 16):
+        n_digits += integers >= 10**k
+    width = int(n_digits.max(initial=1)) + 1
+    chars = np.empty((len(values), width + ndigits + 2), dtype=np.uint8)
+    is_used = np.empty(chars.shape, dtype=np.bool_)
+
+    remainder = integers
+    for column in range(width - 1, 0, -1):
+        remainder, digit = np.divmod(remainder, 10)
+        chars[:, column] = digit + ord("0")
+        is_used[:, column] = column >= width - n_digits
+    is_used[:, 0] = False
+    sign_columns = width - 1 - n_digits[is_negative]
+    chars[is_negative, sign_columns] = ord("-")
+    is_used[is_negative, sign_columns] = True
+
+    chars[:, width] = ord(".")
+    is_used[:, width] = fractions > 0
+    for k in range(ndigits):
+        power = 10 ** (ndigits - 1 - k)
+        chars[:, width + 1 + k] = fractions // power % 10 + ord("0")
+        is_used[:, width + 1 + k] = fractions % (power * 10) > 0
+    chars[:, -1] = ord("\n")
+    is_used[:, -1] = True
+
+    strings = chars[is_used].tobytes().decode("ascii").split("\n")[:-1]
+    for i in np.flatnonzero(~is_exact):
+        strings[i] = my_float_format(values[i], ndigits)
+    return strings
@@ -0,0 +1,45 @@
+from typing import Tuple
+
+import numpy as np
+
+
+class PointsIndex:
+    """
+    Points of a curve sorted by x, built once. Nearest point to a position
+    is searched only among points with x within search radius, found by
+    binary search, instead of over all points of the curve.
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        indexes = np.flatnonzero(~(np.isnan(xs) | np.isnan(ys)))
+        valid_xs = xs[indexes]
+        if np.any(valid_xs[1:] < valid_xs[:-1]):
+            indexes = indexes[np.argsort(valid_xs, kind="stable")]
+        # Indexes of points in original arrays in order of x
+        self.indexes = indexes
+        self.xs = xs[indexes]
+        self.ys = ys[indexes]
+        return
+
+    def find_nearest(
+        self, x: float, y: float, x_scale: float, y_scale: float, radius: float
+    ) -> Tuple[int, float] | None:
+        """
+        Index in original arrays of point nearest to (x, y) and its distance,
+        if distance is at most `radius`. Scales are data units per pixel, so
+        distance and `radius` are in pixels.
+        """
+        start = np.searchsorted(self.xs, x - radius * x_scale, side="left")
+        end = np.searchsorted(self.xs, x + radius * x_scale, side="right")
+        if start == end:
+            return None
+
+        distances = np.hypot(
+            (self.xs[start:end] - x) / x_scale, (self.ys[start:end] - y) / y_scale
+        )
+        i = int(np.argmin(distances))
+        if distances[i] > radius:
+            return None
+        return int(self.indexes[start + i]), float(distances[i])
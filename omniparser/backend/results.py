@@ -0,0 +1,190 @@
+from typing import Callable, List, Sequence, TextIO, Tuple
+from math import isnan
+import io
+import re
+
+import numpy as np
+
+from backend.LIVdata import LIVdata
+from backend.LTdata import LTdata
+from backend.PULSEdata import PULSEdata
+from backend.misc import my_float_format, format_floats
+
+TSV_DELIMITER = "\t"
+CSV_DELIMITER = ","
+# Number of cells formatted and written at once on export
+EXPORT_CHUNK_SIZE = 10_000
+
+
+def format_cell(value, ndigits: int) -> str:
+    # None
+    if value is None:
+        return ""
+
+    # Float
+    if isinstance(value, float):
+        if isnan(value):
+            return "NaN"
+        return my_float_format(value, ndigits)
+
+    # String
+    if isinstance(value, str):
+        if "nan" == value.lower().strip():
+            return "NaN"
+        return value
+
+    return ""
+
+
+def quote_csv_cell(cell: str) -> str:
+    # Same quoting as `csv.QUOTE_MINIMAL`, names like "Power, W" have commas
+    if any(char in cell for char in ',"\r\n'):
+        return '"' + cell.replace('"', '""') + '"'
+    return cell
+
+
+def format_cells(values: Sequence, ndigits: int) -> List[str]:
+    """`format_cell` of every value, float arrays are formatted at once"""
+    if isinstance(values, np.ndarray) and values.dtype == np.float64:
+        cells = format_floats(values, ndigits)
+        for i in np.flatnonzero(np.isnan(values)):
+            cells[i] = "NaN"
+        return cells
+    return [format_cell(value, ndigits) for value in values]
+
+
+class ResultTable:
+    """
+    Result table without Qt: for every data optional "Name", other data, one
+    row per series and spectra rows, datas separated by an empty row.
+
+    Rows keep references to parsed arrays and cells are formatted only when
+    requested, so long series cost nothing until they are shown or exported.
+    """
+
+    def __init__(
+        self,
+        datas: List[LIVdata | LTdata | PULSEdata],
+        add_naming: bool = True,
+        ndigits: int = 2,
+    ) -> None:
+        self.ndigits = ndigits
+        # Row is (leading cells, values), cells of a row are both put together
+        self.rows: List[Tuple[Sequence, Sequence]] = []
+
+        for data_i, data in enumerate(datas):
+            # Append naming
+            if add_naming:
+                self.append_row(("Name", data.other_data["Name"]))
+
+            # Append other data
+            for name, value in data.other_data.items():
+                if name == "Name":
+                    continue
+
+                if re.search("frequency", name.lower()):
+                    self.append_row((name, f"{value:.0f} Hz"))
+                elif re.search("duration", name.lower()):
+                    self.append_row((name, format_cell(value, ndigits) + " ms"))
+                else:
+                    self.append_row((name, value))
+
+            # Append series
+            series = data.LT if isinstance(data, LTdata) else data.LIV
+            for name, values in series.items():
+                self.append_row((name,), values)
+
+            # Append spectra
+            spectra = [] if isinstance(data, LTdata) else data.spectra
+            for spectrum in spectra:
+                for name, values in spectrum.get_rows():
+                    self.append_row((name,), values)
+
+            # Append empty row spacer
+            if data_i != len(datas) - 1:
+                self.append_row(())
+
+        self.n_cols = max((len(a) + len(b) for a, b in self.rows), default=0)
+        return
+
+    def append_row(self, cells: Sequence, values: Sequence = ()) -> None:
+        self.rows.append((cells, values))
+        return
+
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    def column_count(self) -> int:
+        return self.n_cols
+
+    def cell_count(self) -> int:
+        # Rows are padded to the longest one on export
+        return self.row_count() * self.n_cols
+
+    def row_length(self, i: int) -> int:
+        cells, values = self.rows[i]
+        return len(cells) + len(values)
+
+    def cell(self, i: int, j: int) -> str:
+        cells, values = self.rows[i]
+        if j < len(cells):
+            return format_cell(cells[j], self.ndigits)
+        j -= len(cells)
+        if j < len(values):
+            return format_cell(values[j], self.ndigits)
+        return ""
+
+    def row_cells(self, i: int, start: int = 0, end: int | None = None) -> List[str]:
+        """Formatted cells `start:end` of row `i`, without padding"""
+        cells, values = self.rows[i]
+        values_start = max(start - len(cells), 0)
+        values_end = None if end is None else max(end - len(cells), 0)
+        return format_cells(cells[start:end], self.ndigits) + format_cells(
+            values[values_start:values_end], self.ndigits
+        )
+
+    def write(
+        self,
+        file: TextIO,
+        delimiter: str = TSV_DELIMITER,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """
+        Write table as text, layout is the same as of "Quick clipboard".
+        Cells are formatted and written in chunks, so the whole text is never
+        kept in memory. `progress(n_done, n_cells)` is called after each chunk.
+        """
+        quote = quote_csv_cell if delimiter == CSV_DELIMITER else None
+        n_cells = self.cell_count()
+        n_done = 0
+        for i in range(self.row_count()):
+            if i > 0:
+                file.write("\n")
+
+            length = self.row_length(i)
+            for start in range(0, length, EXPORT_CHUNK_SIZE):
+                cells = self.row_cells(i, start, start + EXPORT_CHUNK_SIZE)
+                if quote is not None:
+                    cells = map(quote, cells)
+                if start > 0:
+                    file.write(delimiter)
+                file.write(delimiter.join(cells))
+                if progress is not None:
+                    progress(n_done + min(start + EXPORT_CHUNK_SIZE, length), n_cells)
+
+            # Rows are padded with empty cells to length of the longest one
+            file.write(delimiter * (self.n_cols - max(length, 1)))
+            n_done += self.n_cols
+            if progress is not None:
+                progress(n_done, n_cells)
+        return
+
+    def to_tsv(self) -> str:
+        # Same text as "Quick clipboard" of result subwindow
+        buffer = io.StringIO()
+        self.write(buffer)
+        return buffer.getvalue()
+
+    def write_tsv(self, file: TextIO) -> None:
+        self.write(file)
+        return
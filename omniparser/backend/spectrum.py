@@ -0,0 +1,86 @@
+from typing import List, Iterator, Tuple
+
+import numpy as np
+
+from backend.tokenizer import parse_number_table
+
+
+class Spectrum:
+    """
+    Spectra of one measurement block as one contiguous matrix: intensity of
+    every wavelength (rows) for every current (columns).
+
+    Currents are kept as written in file, `DAT` is None for files without
+    DAT blocks. `wavelength_name` is a name of wavelength row in result table.
+    """
+
+    def __init__(
+        self,
+        currents: List[str],
+        wavelengths: np.ndarray,
+        intensities: np.ndarray,
+        wavelength_name: str,
+        DAT: str | None = None,
+    ) -> None:
+        self.currents = np.array(currents, dtype=np.str_)
+        self.wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        self.intensities = np.asarray(intensities, dtype=np.float64)
+        self.wavelength_name = wavelength_name
+        self.DAT = DAT
+        return
+
+    def get_intensity_name(self, j: int) -> str:
+        if self.DAT is None:
+            return f"Intensity (current={self.currents[j]}A)"
+        return f"Intensity (current={self.currents[j]}A, DAT={self.DAT} ms)"
+
+    def get_intensity(self, j: int) -> np.ndarray:
+        return self.intensities[:, j]
+
+    def get_rows(self) -> Iterator[Tuple[str, np.ndarray]]:
+        """Rows of result table: wavelengths, then intensity for each current"""
+        yield self.wavelength_name, self.wavelengths
+        for j in range(len(self.currents)):
+            yield self.get_intensity_name(j), self.get_intensity(j)
+        return
+
+
+def parse_spectrum_table(
+    lines: List[str], start: int, N_currents: int
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Parse rows "wavelength intensity1 intensity2 ..." from line `start`.
+    Returns wavelengths, intensities matrix and index of line after table.
+    """
+    table, end = parse_number_table(lines, start, N_currents + 1)
+    return table[:, 0], table[:, 1:], end
+
+
+def find_half_max_width(xs: np.ndarray, ys: np.ndarray) -> float:
+    """
+    Width of a peak at 1/2 of maximum: interpolated crossings of half maximum
+    found from the start and from the end of the curve.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    y_half = np.max(ys) / 2
+
+    # Segments (i, i + 1) crossing half maximum
+    crossings = np.flatnonzero((ys[:-1] - y_half) * (ys[1:] - y_half) < 0)
+    if not len(crossings):
+        raise Exception("Could not find first half point")
+    last_crossings = crossings[crossings >= 2]
+    if not len(last_crossings):
+        raise Exception("Could not find second half point")
+    i1, i2 = crossings[0], last_crossings[-1]
+
+    x11, x12, y11, y12 = xs[i1], xs[i1 + 1], ys[i1], ys[i1 + 1]
+    k1 = (y12 - y11) / (x12 - x11)
+    b1 = y11 - k1 * x11
+    x1 = (y_half - b1) / k1
+
+    x21, x22, y21, y22 = xs[i2], xs[i2 + 1], ys[i2], ys[i2 + 1]
+    k2 = (y22 - y21) / (x22 - x21)
+    b2 = y21 - k2 * x21
+    x2 = (y_half - b2) / k2
+    return abs(x2 - x1)
@@ -0,0 +1,74 @@
+from typing import List, Tuple
+from math import nan
+import io
+import re
+
+import numpy as np
+
+NUMBER_PATTERN = r"[-+]?\d*\.?\d+|NaN|nan|NAN"
+NUMBER_REGEX = re.compile(NUMBER_PATTERN)
+
+# Text made only of digits, signs, dots, whitespace and separate NaN words.
+# Whitespace split of such text gives the same numbers as NUMBER_REGEX, unless
+# some token is malformed (e.g. "1.2.3"), which float conversion rejects.
+PLAIN_NUMBERS_REGEX = re.compile(
+    r"[0-9.+\-\s]*(?:(?<!\S)(?:NaN|nan|NAN)[0-9.+\-\s]*)*"
+)
+
+
+def convert_to_float_or_nan(string: str | None) -> float:
+    """Single value, NaN if it is missing or not a number"""
+    try:
+        return float(string)
+    except (TypeError, ValueError):
+        return nan
+
+
+def find_numbers(line: str) -> List[str]:
+    """Numbers of line as written in file, e.g. currents used in row names"""
+    return NUMBER_REGEX.findall(line)
+
+
+def parse_numbers(line: str) -> List[float]:
+    """
+    All numbers of line as floats, same as converting every number of
+    `find_numbers`. Rows of plain whitespace separated numbers are split and
+    converted in one call, other rows are tokenized by regex.
+    """
+    if PLAIN_NUMBERS_REGEX.fullmatch(line):
+        try:
+            return list(map(float, line.split()))
+        except ValueError:
+            pass
+    # Every regex match is a valid float, NaN words included
+    return list(map(float, NUMBER_REGEX.findall(line)))
+
+
+def parse_number_table(
+    lines: List[str], start: int, N_cols: int
+) -> Tuple[np.ndarray, int]:
+    """
+    Parse rows of numbers from line `start` until a line without numbers into
+    (row x N_cols) array, missing values are NaN and extra ones are ignored.
+    Tables of plain numbers with N_cols in every row are loaded at once by
+    `np.loadtxt`, others row by row. Returns table and index of line after it.
+    """
+    end = start
+    while end < len(lines) and NUMBER_REGEX.search(lines[end]):
+        end += 1
+
+    text = "".join(lines[start:end])
+    if end > start and PLAIN_NUMBERS_REGEX.fullmatch(text):
+        try:
+            table = np.loadtxt(io.StringIO(text), comments=None, ndmin=2)
+        except ValueError:
+            # Rows of different length or malformed numbers
+            table = None
+        if table is not None and table.shape == (end - start, N_cols):
+            return table, end
+
+    table = np.full((end - start, N_cols), nan)
+    for row_i, line in enumerate(lines[start:end]):
+        numbers = parse_numbers(line)[:N_cols]
+        table[row_i, : len(numbers)] = numbers
+    return table, end
@@ -0,0 +1,74 @@
+"""
+LIV+spectrum file parsing: full-file pass per section marker and header
+pattern versus single-scan line index.
+
+Run from `omniparser` directory:
+    python -m benchmarks.bench_LIV
+"""
+
+from time import perf_counter
+import os
+import re
+import tempfile
+
+from backend.LIVdata import (
+    LIVdata,
+    LIVparser,
+    LIV_SECTION_MARKERS,
+    SPECTRUM_SECTION_MARKER,
+    OTHER_DATA_PATTERNS,
+)
+from benchmarks.samples import LIV_lines, write_lines
+
+N_WAVELENGTHS = 20_000
+
+
+def find_sections_full_passes(lines):
+    """First implementation: one pass over file per marker and per pattern"""
+    section_is = []
+    for section_marker in [*LIV_SECTION_MARKERS, SPECTRUM_SECTION_MARKER]:
+        for i, line in enumerate(lines):
+            if section_marker in line:
+                section_is.append(i)
+    values = []
+    for pattern in OTHER_DATA_PATTERNS.values():
+        for line in lines:
+            match = re.search(pattern, line)
+            if match:
+                values.append(match.group(1))
+                break
+    return section_is, values
+
+
+def bench(name: str, function, N_lines: int) -> None:
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {N_lines / elapsed:>12,.0f} lines/s")
+    return
+
+
+if __name__ == "__main__":
+    parser = LIVparser()
+    for N_DATs in [1, 2, 3]:
+        lines = LIV_lines(N_WAVELENGTHS, N_DATs=N_DATs)
+        print(f"{N_DATs} DAT block(s), {len(lines):,} lines")
+
+        data = LIVdata("")
+        data.lines = lines
+        bench(
+            "section search, full passes",
+            lambda: find_sections_full_passes(lines),
+            len(lines),
+        )
+        bench(
+            "section search, line index",
+            lambda: (parser.index_lines(data), parser.parse_other_data(data)),
+            len(lines),
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "LIV.txt")
+            write_lines(filepath, lines)
+            bench("LIVparser.parse", lambda: parser.parse(filepath), len(lines))
+        print()
@@ -0,0 +1,161 @@
+"""
+GIVIK2 data row parsing speed: findall per field, single-pass row tokenizer
+and bulk block parsing. Relative time normalisation: timedelta per row
+versus array pipeline.
+
+Run from `omniparser` directory:
+    python -m benchmarks.bench_LT_GIVIK2
+"""
+
+from typing import List
+from datetime import timedelta
+from time import perf_counter
+import re
+
+import numpy as np
+
+from backend.LTdata import LTdata, LTparser, RELETIVE_TIME_PATTERN, GIVIK2_COLUMNS
+from backend.tokenizer import NUMBER_PATTERN, convert_to_float_or_nan
+from benchmarks.samples import GIVIK2_lines
+
+N_ROWS = 200_000
+
+
+def parse_GIVIK2_row_findall(line: str):
+    """First implementation: one `re.findall` per field"""
+    rel_time = re.findall(RELETIVE_TIME_PATTERN, line)[-1]
+    current = re.findall(NUMBER_PATTERN, line)[9]
+    voltage = re.findall(NUMBER_PATTERN, line)[10]
+    power_avg = re.findall(NUMBER_PATTERN, line)[11]
+    tank_water_temp = re.findall(NUMBER_PATTERN, line)[13]
+    return rel_time, [
+        convert_to_float_or_nan(current),
+        convert_to_float_or_nan(voltage),
+        convert_to_float_or_nan(power_avg),
+        convert_to_float_or_nan(tank_water_temp),
+    ]
+
+
+# Reference implementation of relative time normalisation, one value at a time
+
+
+def convert_string_to_timedelta(string: str) -> timedelta:
+    H, M, S = [int(each) for each in string.split(":")]
+    return timedelta(hours=H, minutes=M, seconds=S)
+
+
+def convert_timedelta_to_hours(delta: timedelta) -> float:
+    return delta.total_seconds() / 3600
+
+
+def normalize_time(times: List[float]) -> List[float]:
+    delta_t_threshold = 1  # h
+    normal_time = [
+        times[0],
+    ]
+    base_time = 0.0
+    for i in range(len(times) - 1):
+        t1, t2 = times[i], times[i + 1]
+        if abs(t2 - t1) > delta_t_threshold:
+            base_time += t1
+        normal_time.append(base_time + t2)
+    return normal_time
+
+
+def convert_hours_float_to_timedelta(hours: float) -> timedelta:
+    return timedelta(seconds=hours * 3600)
+
+
+def convert_timedelta_to_string(td: timedelta) -> str:
+    D, S = td.days, td.seconds
+    H = D * 24 + S // 3600
+    rem_S = S % 3600
+    M = rem_S // 60
+    rem_S = rem_S % 60
+    HMS_strs = [str(H).rjust(2, "0"), str(M).rjust(2, "0"), str(rem_S).rjust(2, "0")]
+    return ":".join(HMS_strs)
+
+
+def normalize_rel_times_timedelta(rel_times):
+    """First implementation: a timedelta per row in every step"""
+    timedeltas = [convert_string_to_timedelta(each) for each in rel_times]
+    float_times = [convert_timedelta_to_hours(each) for each in timedeltas]
+    float_times = [round(each, ndigits=5) for each in float_times]
+    normal_float_times = normalize_time(float_times)
+    normal_timedeltas = [
+        convert_hours_float_to_timedelta(each) for each in normal_float_times
+    ]
+    normal_time_strings = [
+        convert_timedelta_to_string(each) for each in normal_timedeltas
+    ]
+    return normal_time_strings, normal_float_times
+
+
+def normalize_rel_times_arrays(parser: LTparser, rel_times, values):
+    data = LTdata("")
+    parser.add_LT_GIVIK2(data, rel_times, values)
+    return data.LT["Reletive time"], data.LT["Reletive time, h"]
+
+
+def bench(name: str, function, N_rows: int) -> None:
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {N_rows / elapsed:>12,.0f} rows/s")
+    return
+
+
+if __name__ == "__main__":
+    rows = GIVIK2_lines(N_ROWS)[5:-1]
+    parser = LTparser()
+
+    rel_times, values = parser.parse_LT_block(rows, GIVIK2_COLUMNS)
+    for i, row in enumerate(rows[:1000]):
+        rel_time, row_values = parse_GIVIK2_row_findall(row)
+        assert parser.parse_row(row, GIVIK2_COLUMNS) == (rel_time, row_values)
+        assert rel_times[i] == rel_time
+        assert np.array_equal(values[i], row_values)
+
+    # Chunk with a bad cell is parsed row by row, other rows and cells keep
+    # values of bulk parsing, bad cell is NaN
+    bad_rows = list(rows[:1000])
+    fields = bad_rows[500].split("\t")
+    fields[3] = "ERR"  # current
+    bad_rows[500] = "\t".join(fields)
+    bad_rel_times, bad_values = parser.parse_LT_block(bad_rows, GIVIK2_COLUMNS)
+    expected_values = values[:1000].copy()
+    expected_values[500, 0] = np.nan
+    assert np.array_equal(bad_rel_times, rel_times[:1000])
+    assert np.array_equal(bad_values, expected_values, equal_nan=True)
+
+    bench(
+        "findall per field",
+        lambda: [parse_GIVIK2_row_findall(row) for row in rows],
+        len(rows),
+    )
+    bench(
+        "single-pass row tokenizer",
+        lambda: [parser.parse_row(row, GIVIK2_COLUMNS) for row in rows],
+        len(rows),
+    )
+    bench(
+        "bulk block parsing",
+        lambda: parser.parse_LT_block(rows, GIVIK2_COLUMNS),
+        len(rows),
+    )
+
+    strings, hours = normalize_rel_times_timedelta(rel_times)
+    array_strings, array_hours = normalize_rel_times_arrays(parser, rel_times, values)
+    assert array_strings.tolist() == strings
+    assert array_hours.tolist() == hours
+
+    bench(
+        "time normalisation, timedelta",
+        lambda: normalize_rel_times_timedelta(rel_times),
+        len(rows),
+    )
+    bench(
+        "time normalisation, arrays",
+        lambda: normalize_rel_times_arrays(parser, rel_times, values),
+        len(rows),
+    )
@@ -0,0 +1,106 @@
+"""
+PULSE file parsing: full-file pass per table versus single-scan line index
+with tables parsed into preallocated arrays.
+
+Run from `omniparser` directory:
+    python -m benchmarks.bench_PULSE
+"""
+
+from time import perf_counter
+import os
+import re
+import tempfile
+
+from backend.PULSEdata import (
+    PULSEdata,
+    PULSEparser,
+    SECTION_MARKER,
+    LIV_COLUMNS,
+    SPECTRUM_COLUMNS,
+)
+from backend.tokenizer import NUMBER_PATTERN, convert_to_float_or_nan
+from benchmarks.samples import PULSE_lines, write_lines
+
+N_WAVELENGTHS = 20_000
+N_FILES = 20
+
+
+def parse_section_table_full_pass(lines, N_cols):
+    """First implementation: pass over whole file to find section marker"""
+    section_is = [i for i, line in enumerate(lines) if SECTION_MARKER in line]
+    if not section_is:
+        return None
+    i = section_is[0]
+    while not re.findall(NUMBER_PATTERN, lines[i]):
+        i += 1
+    columns = [[] for _ in range(N_cols)]
+    while foundall := re.findall(NUMBER_PATTERN, lines[i]):
+        for column, value in zip(columns, foundall):
+            column.append(convert_to_float_or_nan(value))
+        i += 1
+    return columns
+
+
+def parse_full_passes(lines):
+    mode = lines[0]
+    tables = []
+    if "LIV" in mode:
+        tables.append(parse_section_table_full_pass(lines, len(LIV_COLUMNS)))
+    if "Spectrum" in mode:
+        tables.append(parse_section_table_full_pass(lines, len(SPECTRUM_COLUMNS)))
+        for line_i, line in enumerate(lines):
+            if re.match(r"Current, A\s+\d+\s+", line):
+                break
+        else:
+            return tables
+        currents = re.findall(NUMBER_PATTERN, lines[line_i])
+        intensities = [[] for _ in currents]
+        wavelengths = []
+        i = line_i + 2
+        while i < len(lines) and (foundall := re.findall(NUMBER_PATTERN, lines[i])):
+            wavelengths.append(float(foundall[0]))
+            for intensity, value in zip(intensities, foundall[1:]):
+                intensity.append(float(value))
+            i += 1
+        tables.append((wavelengths, intensities))
+    return tables
+
+
+def bench(name: str, function, N_lines: int) -> None:
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {N_lines / elapsed:>12,.0f} lines/s")
+    return
+
+
+if __name__ == "__main__":
+    parser = PULSEparser()
+    for mode in ["LIV", "Spectrum", "LIV Spectrum"]:
+        lines = PULSE_lines(N_WAVELENGTHS, mode=mode)
+        print(f"mode '{mode}', {len(lines):,} lines")
+
+        def parse_lines():
+            data = PULSEdata("")
+            data.lines = lines
+            parser.parse_lines(data)
+            return data
+
+        bench("tables, full passes", lambda: parse_full_passes(lines), len(lines))
+        bench("tables, line index", parse_lines, len(lines))
+        print()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepaths = []
+        for i in range(N_FILES):
+            mode = ["LIV", "Spectrum", "LIV Spectrum"][i % 3]
+            filepath = os.path.join(tmp_dir, f"PULSE_{i}.txt")
+            write_lines(filepath, PULSE_lines(N_WAVELENGTHS // 10, mode=mode, seed=i))
+            filepaths.append(filepath)
+
+        start = perf_counter()
+        for filepath in filepaths:
+            parser.parse(filepath)
+        elapsed = perf_counter() - start
+        print(f"PULSEparser.parse, {N_FILES} mixed files")
+        print(f"{'':<32} {N_FILES / elapsed:>12,.0f} files/s")
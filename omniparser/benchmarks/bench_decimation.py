@@ -0,0 +1,48 @@
+"""
+Min/max decimation of long curves for plotting: points drawn and time of
+`decimate_min_max` for full range and for zoomed range.
+
+Run from `omniparser` directory:
+    python -m benchmarks.bench_decimation
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from backend.decimation import decimate_min_max
+
+N_POINTS = 3_000_000
+N_BINS = 400
+
+
+def bench(name: str, function, N_points: int) -> None:
+    start = perf_counter()
+    indexes = function()
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {N_points / elapsed:>14,.0f} points/s {len(indexes):>8} drawn")
+    return
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    # One month of LT measurement with 1 s sampling, with spike and dropout
+    xs = np.arange(N_POINTS) / 3600
+    ys = 1 + rng.normal(0, 0.01, N_POINTS)
+    ys[N_POINTS // 3] = 5
+    ys[N_POINTS // 2 : N_POINTS // 2 + 10] = np.nan
+
+    indexes = decimate_min_max(xs, ys, xs[0], xs[-1], N_BINS)
+    assert np.nanmax(ys[indexes]) == np.nanmax(ys)
+    assert np.isnan(ys[indexes]).any()
+
+    bench(
+        "full range",
+        lambda: decimate_min_max(xs, ys, xs[0], xs[-1], N_BINS),
+        N_POINTS,
+    )
+    bench(
+        "zoomed to 1/10",
+        lambda: decimate_min_max(xs, ys, xs[0], xs[N_POINTS // 10], N_BINS),
+        N_POINTS // 10,
+    )
@@ -0,0 +1,41 @@
+"""
+Result table number formatting: `my_float_format` per value versus
+`format_floats` per array.
+
+Run from `omniparser` directory:
+    python -m benchmarks.bench_format
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from backend.misc import my_float_format, format_floats
+
+N_VALUES = 1_000_000
+
+
+def bench(name: str, function, N_values: int) -> None:
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {N_values / elapsed:>12,.0f} values/s")
+    return
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for ndigits, high in [(2, 10), (2, 1e4), (4, 1e4)]:
+        values = rng.uniform(-high, high, N_VALUES)
+        print(f"ndigits={ndigits}, values up to {high:g}")
+        assert format_floats(values[:10_000], ndigits) == [
+            my_float_format(value, ndigits) for value in values[:10_000].tolist()
+        ]
+
+        bench(
+            "my_float_format",
+            lambda: [my_float_format(value, ndigits) for value in values.tolist()],
+            N_VALUES,
+        )
+        bench("format_floats", lambda: format_floats(values, ndigits), N_VALUES)
+        print()
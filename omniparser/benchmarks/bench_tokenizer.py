@@ -0,0 +1,96 @@
+"""
+Numeric row parsing: `re.findall` with per-value `convert_to_float_or_nan`
+versus shared tokenizer, for single rows and whole tables.
+
+Run from `omniparser` directory:
+    python -m benchmarks.bench_tokenizer
+"""
+
+from time import perf_counter
+from math import nan
+import random
+import re
+
+import numpy as np
+
+from backend.tokenizer import (
+    NUMBER_PATTERN,
+    convert_to_float_or_nan,
+    parse_numbers,
+    parse_number_table,
+)
+
+N_ROWS = 20_000
+N_COLS = 21
+
+
+def parse_numbers_findall(line: str):
+    """First implementation: regex tokens converted one by one"""
+    values = re.findall(NUMBER_PATTERN, line)
+    return [convert_to_float_or_nan(value) for value in values]
+
+
+def parse_number_table_findall(lines, N_cols: int):
+    table = np.full((len(lines), N_cols), nan)
+    for row_i, line in enumerate(lines):
+        numbers = parse_numbers_findall(line)[:N_cols]
+        table[row_i, : len(numbers)] = numbers
+    return table
+
+
+def table_lines(N_rows: int, N_cols: int, nan_share: float, seed: int = 0):
+    rnd = random.Random(seed)
+
+    def value() -> str:
+        return "NaN" if rnd.random() < nan_share else f"{rnd.uniform(0, 100):.3f}"
+
+    return ["\t".join(value() for _ in range(N_cols)) + "\n" for _ in range(N_rows)]
+
+
+def bench(name: str, function, N_rows: int) -> None:
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    print(f"{name:<32} {N_rows / elapsed:>12,.0f} rows/s")
+    return
+
+
+if __name__ == "__main__":
+    cases = {
+        "plain numbers": table_lines(N_ROWS, N_COLS, 0),
+        "10% NaN": table_lines(N_ROWS, N_COLS, 0.1),
+        "named rows": ["Power, W\t" + line for line in table_lines(N_ROWS, N_COLS, 0)],
+    }
+    for case, lines in cases.items():
+        print(f"{case}, {len(lines):,} rows x {N_COLS} columns")
+        for line in lines[:1000]:
+            assert np.array_equal(
+                parse_numbers(line), parse_numbers_findall(line), equal_nan=True
+            )
+        assert np.array_equal(
+            parse_number_table(lines, 0, N_COLS)[0],
+            parse_number_table_findall(lines, N_COLS),
+            equal_nan=True,
+        )
+
+        bench(
+            "rows, findall + convert",
+            lambda: [parse_numbers_findall(line) for line in lines],
+            len(lines),
+        )
+        bench(
+            "rows, parse_numbers",
+            lambda: [parse_numbers(line) for line in lines],
+            len(lines),
+        )
+        bench(
+            "table, findall + convert",
+            lambda: parse_number_table_findall(lines, N_COLS),
+            len(lines),
+        )
+        bench(
+            "table, parse_number_table",
+            lambda: parse_number_table(lines, 0, N_COLS),
+            len(lines),
+        )
+        print()
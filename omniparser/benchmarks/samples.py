@@ -0,0 +1,109 @@
+"""Synthetic measurement files for benchmarks."""
+
+from typing import List
+import random
+
+GIVIK2_SECTION_MARKER = "#" * 258
+GIVIK2_LT_MARKER = "-" * 261
+
+
+def GIVIK2_row(rnd: random.Random, row_i: int, seconds: int) -> str:
+    H, M, S = seconds // 3600, seconds % 3600 // 60, seconds % 60
+    return "\t".join(
+        [
+            f"01.02.2024 12:{row_i % 60:02d}:{row_i * 7 % 60:02d}",
+            f"{H}:{M:02d}:{S:02d}",
+            f"{1000 + row_i}",
+            f"{rnd.uniform(4, 6):.3f}",
+            f"{rnd.uniform(1, 2):.3f}",
+            f"{rnd.uniform(0, 3):.4f}",
+            f"{rnd.uniform(1, 9):.3f}",
+            f"{rnd.uniform(20, 30):.1f}",
+        ]
+    )
+
+
+def GIVIK2_lines(N_rows: int, N_sections: int = 1, seed: int = 0) -> List[str]:
+    rnd = random.Random(seed)
+    lines = []
+    for section_i in range(N_sections):
+        lines.append(GIVIK2_SECTION_MARKER)
+        lines.append("Pulse width: 0.2 ms")
+        lines.append("Repetition frequency: 10 Hz")
+        lines.append("Set operating current: 5.5 A")
+        lines.append(GIVIK2_LT_MARKER)
+        seconds = 0
+        for row_i in range(N_rows // N_sections):
+            seconds += 5
+            lines.append(GIVIK2_row(rnd, row_i, seconds))
+    lines.append("")
+    return [line + "\n" for line in lines]
+
+
+def LIV_lines(
+    N_wavelengths: int, N_currents: int = 20, N_DATs: int = 2, seed: int = 0
+) -> List[str]:
+    rnd = random.Random(seed)
+    sets = [f"{0.5 * i:.1f}" for i in range(N_currents)]
+    currents = [f"{0.5 * (i + 1):.1f}" for i in range(N_currents)]
+    DATs = [f"{10 * i}" for i in range(N_DATs)]
+
+    def LIV_row(name: str) -> str:
+        return "\t".join([name, *(f"{rnd.uniform(0, 5):.4f}" for _ in sets)])
+
+    lines = ["LIV measurement", "Duration: 200us", "Frequency: 1000Hz", ""]
+    lines.append("### LIV Data ###")
+    lines.append("\t".join(["Set, A", *sets]))
+    for name in ["AI_Voltage", "AI_Current", "OPM", "Power, W", "Voltage, V"]:
+        lines.append(LIV_row(name))
+    lines.append("")
+    lines.append("### Spectrum LIV Data ###")
+    lines.append("\t".join(["Set, A", *sets]))
+    for DAT in DATs:
+        lines.append(f"DAT, ms\t{DAT}")
+        lines.append(LIV_row("WLmean, nm"))
+    lines.append("")
+    lines.append("### Spectrum Data ###")
+    for DAT in DATs:
+        lines.append(f"DAT, ms\t{DAT}")
+        lines.append("Integration time, ms\t100")
+        lines.append("Averaging\t1")
+        lines.append("\t".join(["Current, A", *currents]))
+        lines.append("WL, nm\tIntensity")
+        lines.append("--------")
+        for wavelength_i in range(N_wavelengths):
+            intensities = (f"{rnd.uniform(0, 100):.3f}" for _ in currents)
+            lines.append("\t".join([f"{780 + 0.01 * wavelength_i:.2f}", *intensities]))
+        lines.append("")
+    return [line + "\n" for line in lines]
+
+
+def PULSE_lines(
+    N_wavelengths: int, N_currents: int = 20, mode: str = "LIV Spectrum", seed: int = 0
+) -> List[str]:
+    rnd = random.Random(seed)
+    currents = [f"{0.5 * i:.2f}" for i in range(N_currents)]
+
+    lines = [mode, "Pulse Width: 100 ns", "**************"]
+    if "LIV" in mode:
+        lines.append("Current, A\tPower, W\tVoltage, V\tCurrent Monitor, mV")
+    if "Spectrum" in mode:
+        lines.append("Current\tFWHM\tMean WL\tMax WL\tDispersion")
+    for current in currents:
+        values = (f"{rnd.uniform(0, 10):.3f}" for _ in range(4))
+        lines.append("\t".join([current, *values]))
+    lines.append("")
+    if "Spectrum" in mode:
+        lines.append("\t".join(["Current, A", *map(str, range(1, N_currents + 1))]))
+        lines.append("WL, nm")
+        for wavelength_i in range(N_wavelengths):
+            intensities = (f"{rnd.uniform(0, 100):.3f}" for _ in currents)
+            lines.append("\t".join([f"{780 + 0.01 * wavelength_i:.2f}", *intensities]))
+        lines.append("")
+    return [line + "\n" for line in lines]
+
+
+def write_lines(filepath: str, lines: List[str]) -> None:
+    with open(filepath, "w") as file:
+        file.writelines(lines)
+    return
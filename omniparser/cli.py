@@ -0,0 +1,176 @@
+"""
+Headless batch converter: parse LIV/LT/PULSE files and write result tables
+as tab separated text (same layout as "Quick clipboard" of result subwindow)
+or parsed arrays as .npy files.
+
+Example:
+    python cli.py LIV D:\\lots\\2525 --recursive --workers 8 --output-dir out
+"""
+
+from typing import List
+from os.path import join, basename, splitext, isdir, isfile
+from glob import iglob, has_magic
+import argparse
+import os
+import re
+import sys
+
+from backend.batch import KINDS, parse_many
+from backend.cache import DEFAULT_CACHE_DIR, ParseCache
+from backend.columnar import export_columnar
+from backend.misc import get_3_parents_dirs
+from backend.results import ResultTable
+
+# Same defaults as filters of setup subwindows
+DEFAULT_FILENAME_FILTERS = {"LIV": "LIV|SPEC", "LT": "", "PULSE": "pulseLIV|pulseSP"}
+DEFAULT_EXTENSION_FILTERS = {"LIV": "txt", "LT": "txt", "PULSE": "pliv|pspctrm"}
+
+
+def collect_filepaths(
+    sources: List[str], recursive: bool, filename_filter: str, extension_filter: str
+) -> List[str]:
+    filepaths = []
+    for source in sources:
+        if isdir(source):
+            pattern = join(source, "**", "*") if recursive else join(source, "*")
+            found = sorted(iglob(pattern, recursive=recursive))
+        elif has_magic(source):
+            found = sorted(iglob(source, recursive=True))
+        else:
+            found = [source]
+
+        for filepath in found:
+            if not isfile(filepath):
+                continue
+            file_basename = basename(filepath)
+            if filename_filter and not re.search(filename_filter, file_basename):
+                continue
+            extension = splitext(file_basename)[1]
+            if extension_filter and not re.search(extension_filter, extension):
+                continue
+            filepaths.append(filepath)
+
+    # Remove duplicates, keep order
+    return list(dict.fromkeys(filepaths))
+
+
+def get_name(filepath: str, kind: str) -> str:
+    # Same naming as setup subwindows fill in
+    match kind:
+        case "LIV":
+            parents_basenames = map(basename, reversed(get_3_parents_dirs(filepath)))
+            return "-".join([each for each in parents_basenames if each])
+        case "LT":
+            return splitext(basename(filepath))[0]
+        case "PULSE":
+            return basename(filepath)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("kind", choices=KINDS, help="type of measurement files")
+    parser.add_argument(
+        "sources", nargs="+", help="files, folders or glob patterns to parse"
+    )
+    parser.add_argument(
+        "-r", "--recursive", action="store_true", help="search folders recursively"
+    )
+    parser.add_argument(
+        "--filename-filter",
+        default=None,
+        help="python regex for file basenames (default: same as setup window)",
+    )
+    parser.add_argument(
+        "--extension-filter",
+        default=None,
+        help="python regex for file extensions (default: same as setup window)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="number of processes"
+    )
+    parser.add_argument(
+        "-n", "--ndigits", type=int, default=2, help="digits after point"
+    )
+    parser.add_argument(
+        "--no-naming", action="store_true", help="do not add 'Name' rows"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        default=None,
+        help=f"reuse results of unchanged files (default folder: {DEFAULT_CACHE_DIR})",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("-o", "--output", help="write one table for all files")
+    output.add_argument("--output-dir", help="write one table per file into folder")
+    output.add_argument(
+        "--npy-dir", help="write arrays as .npy files and manifest.json into folder"
+    )
+    args = parser.parse_args(argv)
+
+    filename_filter = args.filename_filter
+    if filename_filter is None:
+        filename_filter = DEFAULT_FILENAME_FILTERS[args.kind]
+    extension_filter = args.extension_filter
+    if extension_filter is None:
+        extension_filter = DEFAULT_EXTENSION_FILTERS[args.kind]
+
+    filepaths = collect_filepaths(
+        args.sources, args.recursive, filename_filter, extension_filter
+    )
+    if not filepaths:
+        print("No files found", file=sys.stderr)
+        return 1
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    cache = ParseCache(args.cache_dir) if args.cache_dir else None
+
+    datas = []
+    output_names = {}
+    n_failed = 0
+    results = parse_many(
+        filepaths, args.kind, args.workers, return_exceptions=True, cache=cache
+    )
+    for filepath, data in zip(filepaths, results):
+        if isinstance(data, Exception):
+            print(f"Failed to parse {filepath}: {data}", file=sys.stderr)
+            n_failed += 1
+            continue
+        data.add_other_data("Name", get_name(filepath, args.kind))
+
+        # Write tables of early files while others are still parsing
+        if args.output_dir:
+            output_name = splitext(basename(filepath))[0]
+            output_names[output_name] = output_names.get(output_name, 0) + 1
+            if output_names[output_name] > 1:
+                output_name += f"_{output_names[output_name]}"
+
+            table = ResultTable([data], not args.no_naming, args.ndigits)
+            output_path = join(args.output_dir, output_name + ".tsv")
+            with open(output_path, "w", encoding="utf-8") as file:
+                table.write_tsv(file)
+            continue
+        datas.append(data)
+
+    if datas and args.npy_dir:
+        export_columnar(datas, args.npy_dir)
+    elif datas:
+        table = ResultTable(datas, not args.no_naming, args.ndigits)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                table.write_tsv(file)
+        else:
+            sys.stdout.write(table.to_tsv() + "\n")
+
+    message = f"Parsed {len(filepaths) - n_failed} of {len(filepaths)} files"
+    if cache is not None:
+        message += f" ({cache.hits} from cache)"
+    print(message, file=sys.stderr)
+    return 1 if n_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 
 from PySide6.QtWidgets import QApplication
 import matplotlib as mpl
@@ -10,6 +11,8 @@ mpl.rcParams["savefig.format"] = "png"  # or 'png', 'svg', 'jpg', 'pdf' etc.
 
 
 if __name__ == "__main__":
+    # Needed for parsing process pool in frozen (pyinstaller) executables
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     controller = MainController()
     window = MainWindow(controller)